@@ -2,6 +2,61 @@ import json
 import sys
 from datetime import datetime
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+_HEADER_TEMPLATE = """\
+## BIM Execution Plan Input Summary - {ProjectName}
+Generated: {Generated}
+
+### Project Information
+- Project Number: {ProjectNumber}
+- Project Name: {ProjectName}
+- Project Address: {ProjectAddress}
+- Project Owner/Client: {Client}
+- Project Type: {ProjectType}
+- Contract Type: {ContractType}
+- Project Description: {ProjectDescription}
+- BIM Lead: {BimLead}
+- Coordination Meeting Cadence: {CoordinationMeetingCadence}
+
+### ACC Collaboration Method
+- Primary Method: {PackageMethod}
+- Auto-Publish Cadence: {AutoPublishCadence}
+- Package Sharing Timeline: {SharingFrequency}
+- Package Naming Convention: {PackageNamingConvention}
+
+### Geo-Referencing
+- Geocoordinate System: {GeoCoordinateSystem}
+- Coordinates Acquired From Model: {AcquireCoordinatesFromModel}
+
+### Approved Software Versions
+- Autodesk Revit: {RevitVersion}
+- Autodesk AutoCAD: {AutoCadVersion}
+- Autodesk Civil 3D: {Civil3DVersion}
+- Autodesk Desktop Connector: {DesktopConnectorVersion}
+- Bluebeam Revu: {BluebeamVersion}
+
+"""
+
+_FOOTER = """
+### Recommended Views for ACC Publishing
+- 3D_Coordination (local geometry only)
+- 3D_Coordination_Links (discipline links loaded)
+
+### Notes
+- This output is generated from your form and can be pasted into Notebook B / Notebook D / Appendix E sections.
+- Keep using discipline package naming patterns like '<Project>_Shared for <Purpose>'.
+"""
+
+
+class _Defaulting(dict):
+    def __missing__(self, key):
+        return "[Not set]"
+
 
 def bool_line(enabled, label):
     return f"- {'Yes' if enabled else 'No'}: {label}"
@@ -30,55 +85,18 @@ def build_session_block(sessions, start_fresh):
 
 
 def main():
-    raw = sys.stdin.read()
-    payload = json.loads(raw) if raw.strip() else {}
-
-    project_name = payload.get("ProjectName") or "[Project Name]"
-    package_method = payload.get("PackageMethod") or "[Not Selected]"
-
-    lines = [
-        f"## BIM Execution Plan Input Summary - {project_name}",
-        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        "",
-        "### Project Information",
-        f"- Project Number: {payload.get('ProjectNumber') or '[Not set]'}",
-        f"- Project Name: {project_name}",
-        f"- Project Address: {payload.get('ProjectAddress') or '[Not set]'}",
-        f"- Project Owner/Client: {payload.get('Client') or '[Not set]'}",
-        f"- Project Type: {payload.get('ProjectType') or '[Not set]'}",
-        f"- Contract Type: {payload.get('ContractType') or '[Not set]'}",
-        f"- Project Description: {payload.get('ProjectDescription') or '[Not set]'}",
-        f"- BIM Lead: {payload.get('BimLead') or '[Not set]'}",
-        f"- Coordination Meeting Cadence: {payload.get('CoordinationMeetingCadence') or '[Not set]'}",
-        "",
-        "### ACC Collaboration Method",
-        f"- Primary Method: {package_method}",
-        f"- Auto-Publish Cadence: {payload.get('AutoPublishCadence') or '[Not set]'}",
-        f"- Package Sharing Timeline: {payload.get('SharingFrequency') or '[Not set]'}",
-        f"- Package Naming Convention: {payload.get('PackageNamingConvention') or '[Not set]'}",
-        "",
-        "### Geo-Referencing",
-        f"- Geocoordinate System: {payload.get('GeoCoordinateSystem') or '[Not set]'}",
-        f"- Coordinates Acquired From Model: {payload.get('AcquireCoordinatesFromModel') or '[Not set]'}",
-        "",
-        "### Approved Software Versions",
-        f"- Autodesk Revit: {payload.get('RevitVersion') or '[Not set]'}",
-        f"- Autodesk AutoCAD: {payload.get('AutoCadVersion') or '[Not set]'}",
-        f"- Autodesk Civil 3D: {payload.get('Civil3DVersion') or '[Not set]'}",
-        f"- Autodesk Desktop Connector: {payload.get('DesktopConnectorVersion') or '[Not set]'}",
-        f"- Bluebeam Revu: {payload.get('BluebeamVersion') or '[Not set]'}",
-        "",
-        build_session_block(payload.get("Sessions", []), payload.get("StartFresh", False)),
-        "### Recommended Views for ACC Publishing",
-        "- 3D_Coordination (local geometry only)",
-        "- 3D_Coordination_Links (discipline links loaded)",
-        "",
-        "### Notes",
-        "- This output is generated from your form and can be pasted into Notebook B / Notebook D / Appendix E sections.",
-        "- Keep using discipline package naming patterns like '<Project>_Shared for <Purpose>'.",
-    ]
-
-    sys.stdout.write("\n".join(lines).strip() + "\n")
+    raw = sys.stdin.buffer.read()
+    payload = _loads(raw) if raw.strip() else {}
+
+    fields = _Defaulting((k, v) for k, v in payload.items() if v)
+    fields.setdefault("ProjectName", "[Project Name]")
+    fields.setdefault("PackageMethod", "[Not Selected]")
+    fields["Generated"] = datetime.now().strftime('%Y-%m-%d %H:%M')
+
+    w = sys.stdout.write
+    w(_HEADER_TEMPLATE.format_map(fields))
+    w(build_session_block(payload.get("Sessions", []), payload.get("StartFresh", False)))
+    w(_FOOTER)
 
 
 if __name__ == "__main__":
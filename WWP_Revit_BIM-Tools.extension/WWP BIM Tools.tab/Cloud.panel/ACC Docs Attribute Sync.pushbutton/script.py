@@ -1,31 +1,55 @@
 #! python3
+import functools
+import hashlib
 import json
+import operator
 import os
 import re
+import threading
+import time
 import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from urllib.parse import quote as _url_quote
 from pyrevit import UI
 from pyrevit import script as pyrevit_script
 from System import DateTime, Guid, Type, Activator, Array, Object, Uri, Convert, TimeSpan, Action
 from System.Reflection import BindingFlags
 from System.Runtime.InteropServices import Marshal
-from System.Net import ServicePointManager, SecurityProtocolType, HttpListener, WebRequest, WebException
+from System.Net import ServicePointManager, SecurityProtocolType, WebRequest, WebException, DecompressionMethods
 from System.Text import Encoding
-from System.IO import StreamReader, FileStream, FileMode, FileAccess
-from System.Diagnostics import Process, ProcessStartInfo
+from System.IO import StreamReader
 from System.Threading import Thread, ThreadStart
-from System.Windows import MessageBox, MessageBoxButton, MessageBoxImage
+from System.Windows.Threading import DispatcherPriority, DispatcherTimer
+from System.Windows import MessageBox, MessageBoxButton, MessageBoxImage, MessageBoxResult
 from System.Windows.Controls import TreeViewItem
 from System.Windows.Input import MouseButtonEventHandler
 from System.Windows import RoutedEventHandler
 from System.Collections.ObjectModel import ObservableCollection
-from System.Windows.Markup import XamlReader
-from Microsoft.Win32 import OpenFileDialog
+from System.Collections.Specialized import NotifyCollectionChangedEventArgs, NotifyCollectionChangedAction
+from System.ComponentModel import PropertyChangedEventArgs
+
+OPENPYXL_EXTENSIONS = (".xlsx", ".xlsm")
+
+try:
+    from orjson import loads as _fast_loads
+except ImportError:
+    _fast_loads = json.loads
 
 TITLE = "ACC Docs"
 REDIRECT_URI = "http://127.0.0.1:8765/callback/"
 OAUTH_AUTHORIZE_URL = "https://developer.api.autodesk.com/authentication/v2/authorize"
 OAUTH_TOKEN_URL = "https://developer.api.autodesk.com/authentication/v2/token"
 DEFAULT_SCOPES = "data:read data:write account:read"
+MAX_PARALLEL_REQUESTS = 8
+# total length of the cached response bodies, in characters
+ETAG_CACHE_MAX_CHARS = 8 * 1024 * 1024
+TREE_CACHE_TTL_SECONDS = 60
+LOG_FLUSH_INTERVAL_MS = 75
+RESPONSE_BUFFER_SIZE = 64 * 1024
+EXCEL_CACHE_VERSION = 3
+# DateTime ticks are 100 ns
+TOKEN_EXPIRY_MARGIN_TICKS = 2 * 60 * 10000000
 
 ServicePointManager.SecurityProtocol = SecurityProtocolType.Tls12
 
@@ -45,6 +69,29 @@ EXCEL_ATTRIBUTE_ALIASES = {
     "item_name": "display_name",
 }
 
+# nbsp -> space, drop bidi marks, fold dash variants to "-"
+_NAME_TRANSLATION = str.maketrans({
+    u"\u00A0": u" ",
+    u"\u200e": None,
+    u"\u200f": None,
+    u"\u202a": None,
+    u"\u202b": None,
+    u"\u202c": None,
+    u"\u2013": u"-",
+    u"\u2014": u"-",
+    u"\u2212": u"-",
+})
+_WS_RE = re.compile(r"\s+")
+_PROJECT_URL_RE = re.compile(r"/projects/([a-zA-Z0-9\-\.]+)")
+_FOLDER_URL_RE = re.compile(r"/folders/([^/?#]+)")
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_text(text):
+    # the same file and header names recur on every refresh and apply
+    text = _WS_RE.sub(" ", text.translate(_NAME_TRANSLATION)).strip()
+    return text.lower() if text.isascii() else text.casefold()
+
 
 def _load_env_file(path):
     data = {}
@@ -72,6 +119,8 @@ def _get_env_credentials():
         creds[ENV_CLIENT_ID_KEY] = os.environ.get(ENV_CLIENT_ID_KEY)
     if os.environ.get(ENV_CLIENT_SECRET_KEY):
         creds[ENV_CLIENT_SECRET_KEY] = os.environ.get(ENV_CLIENT_SECRET_KEY)
+    if len(creds) == 2:
+        return creds
 
     # fallback to .env file next to script or extension root
     script_dir = os.path.dirname(__file__)
@@ -89,14 +138,29 @@ def _get_env_credentials():
 
 class ComInterop(object):
     FLAGS = BindingFlags.Public | BindingFlags.Instance | BindingFlags.OptionalParamBinding
+    GET_FLAGS = FLAGS | BindingFlags.GetProperty
+    SET_FLAGS = FLAGS | BindingFlags.SetProperty
+    CALL_FLAGS = FLAGS | BindingFlags.InvokeMethod
+    # every Excel RCW shares the same System.__ComObject type, so resolve it
+    # once per proxy class instead of calling GetType() on each access
+    _types = {}
+
+    @staticmethod
+    def _type_of(target):
+        key = type(target)
+        clr_type = ComInterop._types.get(key)
+        if clr_type is None:
+            clr_type = target.GetType()
+            ComInterop._types[key] = clr_type
+        return clr_type
 
     @staticmethod
     def get(target, name, *args):
         if target is None:
             return None
-        return target.GetType().InvokeMember(
+        return ComInterop._type_of(target).InvokeMember(
             name,
-            ComInterop.FLAGS | BindingFlags.GetProperty,
+            ComInterop.GET_FLAGS,
             None,
             target,
             args,
@@ -106,9 +170,9 @@ class ComInterop(object):
     def set(target, name, value):
         if target is None:
             return
-        target.GetType().InvokeMember(
+        ComInterop._type_of(target).InvokeMember(
             name,
-            ComInterop.FLAGS | BindingFlags.SetProperty,
+            ComInterop.SET_FLAGS,
             None,
             target,
             [value],
@@ -118,9 +182,9 @@ class ComInterop(object):
     def call(target, name, *args):
         if target is None:
             return None
-        return target.GetType().InvokeMember(
+        return ComInterop._type_of(target).InvokeMember(
             name,
-            ComInterop.FLAGS | BindingFlags.InvokeMethod,
+            ComInterop.CALL_FLAGS,
             None,
             target,
             args,
@@ -143,6 +207,22 @@ def coerce_to_2d(values):
     return arr
 
 
+def array_to_rows(values):
+    if values is None:
+        return []
+    row_start = values.GetLowerBound(0)
+    row_end = values.GetUpperBound(0)
+    col_start = values.GetLowerBound(1)
+    col_end = values.GetUpperBound(1)
+    if row_end < row_start or col_end < col_start:
+        return []
+    width = col_end - col_start + 1
+    # enumerating a 2D Array yields its items in row-major order, so the
+    # whole range crosses the interop boundary in a single pass
+    flat = list(values)
+    return [flat[i:i + width] for i in range(0, len(flat), width)]
+
+
 class ExcelRow(object):
     def __init__(self, file_name="", description="", attributes=None):
         self.FileName = file_name
@@ -153,6 +233,46 @@ class ExcelRow(object):
 class ExcelReader(object):
     LastDiagnostics = None
     MaxLogRows = 20
+    # per-row samples are only collected when WWP_EXCEL_DIAG is set
+    DiagnosticsEnabled = bool(os.environ.get("WWP_EXCEL_DIAG"))
+    # a note for the log that is not part of one sheet's diagnostics (and
+    # so never cached with them); taken and cleared by the window
+    PendingWarning = None
+    _lxml_warned = False
+    # one hidden Excel instance is reused across reads; see shutdown()
+    _excel = None
+    _excel_lock = threading.RLock()
+    # set by shutdown(); a read still running then quits the instance it used
+    _closed = False
+
+    @staticmethod
+    def _acquire_workbooks(excel_type):
+        excel = ExcelReader._excel
+        if excel is not None:
+            try:
+                return ComInterop.get(excel, "Workbooks")
+            except Exception:
+                # the pooled instance went away (closed or crashed)
+                ExcelReader._excel = None
+                ComInterop.release(excel)
+        excel = Activator.CreateInstance(excel_type)
+        ComInterop.set(excel, "Visible", False)
+        ExcelReader._excel = excel
+        return ComInterop.get(excel, "Workbooks")
+
+    @staticmethod
+    def shutdown():
+        ExcelReader._closed = True
+        with ExcelReader._excel_lock:
+            excel = ExcelReader._excel
+            ExcelReader._excel = None
+            if excel is None:
+                return
+            try:
+                ComInterop.call(excel, "Quit")
+            except Exception:
+                pass
+            ComInterop.release(excel)
 
     @staticmethod
     def _normalize_name(value):
@@ -162,40 +282,27 @@ class ExcelReader(object):
             text = str(value)
         except Exception:
             return ""
-        try:
-            text = text.replace(u"\u00A0", " ")
-            text = text.replace(u"\u200e", "")
-            text = text.replace(u"\u200f", "")
-            text = text.replace(u"\u202a", "").replace(u"\u202b", "").replace(u"\u202c", "")
-            text = text.replace(u"\u2013", "-").replace(u"\u2014", "-").replace(u"\u2212", "-")
-        except Exception:
-            pass
-        try:
-            text = re.sub(r"\s+", " ", text)
-        except Exception:
-            pass
-        return text.strip().lower()
+        return _normalize_text(text)
 
     @staticmethod
-    def _normalize_base(value):
-        name = ExcelReader._normalize_name(value)
-        if not name:
-            return ""
-        try:
-            base, _ext = os.path.splitext(name)
-        except Exception:
-            return name
-        return base if base else name
+    def _count_filled(grid):
+        # Count non-empty in column A and B (row 2+)
+        body = grid[1:]
+        col_a = [r[0] for r in body if len(r) > 0]
+        col_b = [r[1] for r in body if len(r) > 1]
+        rows = sum(1 for v in col_a if v is not None and str(v).strip())
+        desc_rows = sum(1 for v in col_b if v is not None and str(v).strip())
+        return rows, desc_rows
 
     @staticmethod
-    def _add_result(result, key, row):
-        if key and key not in result:
-            result[key] = row
+    def _is_better(best, rows, desc_rows):
+        if desc_rows > best["desc_rows"]:
+            return True
+        return desc_rows == best["desc_rows"] and rows > best["rows"]
 
     @staticmethod
-    def read_excel(path):
-        result = {}
-        diag = {
+    def _new_diagnostics():
+        return {
             "row_start": None,
             "row_end": None,
             "col_start": None,
@@ -203,39 +310,42 @@ class ExcelReader(object):
             "headers": [],
             "description_index": None,
             "rows_read": 0,
+            "unique_files": 0,
             "samples": [],
             "rows": [],
             "sheet": None,
             "sheet_rows": 0,
             "sheet_desc_rows": 0,
         }
-        excel = None
-        workbooks = None
-        workbook = None
-        worksheets = None
-        sheet = None
-        used_range = None
+
+    @staticmethod
+    def read_excel(path):
+        # openpyxl streams the sheet XML without starting Excel at all
+        if os.path.splitext(path)[1].lower() in OPENPYXL_EXTENSIONS:
+            result = ExcelReader._read_with_openpyxl(path)
+            if result is not None:
+                return result
 
         excel_type = Type.GetTypeFromProgID("Excel.Application")
         if excel_type is None:
             raise Exception("Excel is not installed.")
 
+        workbooks = None
+        workbook = None
+        worksheets = None
+        sheet = None
+
+        ExcelReader._excel_lock.acquire()
         try:
-            excel = Activator.CreateInstance(excel_type)
-            ComInterop.set(excel, "Visible", False)
-            workbooks = ComInterop.get(excel, "Workbooks")
+            workbooks = ExcelReader._acquire_workbooks(excel_type)
             workbook = ComInterop.call(workbooks, "Open", path)
             worksheets = ComInterop.get(workbook, "Worksheets")
             # pick the sheet with the most data in column A/B
-            values = None
             best = {
                 "sheet": None,
-                "used_range": None,
-                "values": None,
+                "grid": None,
                 "row_start": None,
-                "row_end": None,
                 "col_start": None,
-                "col_end": None,
                 "rows": 0,
                 "desc_rows": 0,
             }
@@ -259,74 +369,35 @@ class ExcelReader(object):
                         pass
 
             for idx in range(1, int(sheet_count) + 1):
+                ws = None
+                rng = None
                 try:
                     ws = ComInterop.get(worksheets, "Item", idx)
                     rng = ComInterop.get(ws, "UsedRange")
-                    vals = coerce_to_2d(ComInterop.get(rng, "Value2"))
-                    if vals is None:
-                        ComInterop.release(rng)
+                    raw = ComInterop.get(rng, "Value2")
+                    vals = raw if isinstance(raw, Array) else coerce_to_2d(raw)
+                    grid = array_to_rows(vals)
+                    ComInterop.release(rng)
+                    if not grid:
                         ComInterop.release(ws)
                         continue
 
-                    rs = vals.GetLowerBound(0)
-                    re = vals.GetUpperBound(0)
-                    cs = vals.GetLowerBound(1)
-                    ce = vals.GetUpperBound(1)
-                    if re < rs or ce < cs:
-                        ComInterop.release(rng)
-                        ComInterop.release(ws)
-                        continue
-
-                    # Count non-empty in column A and B (row 2+)
-                    rows = 0
-                    desc_rows = 0
-                    for r in range(rs + 1, re + 1):
-                        v_a = None
-                        v_b = None
-                        try:
-                            v_a = vals[r, cs]
-                        except Exception:
-                            v_a = None
-                        if v_a is None:
-                            v_a = safe_get_sheet_text(ws, r, cs)
-                        if v_a is not None and str(v_a).strip():
-                            rows += 1
-                        if (cs + 1) <= ce:
-                            try:
-                                v_b = vals[r, cs + 1]
-                            except Exception:
-                                v_b = None
-                            if v_b is None:
-                                v_b = safe_get_sheet_text(ws, r, cs + 1)
-                            if v_b is not None and str(v_b).strip():
-                                desc_rows += 1
-
-                    pick = False
-                    if desc_rows > best["desc_rows"]:
-                        pick = True
-                    elif desc_rows == best["desc_rows"] and rows > best["rows"]:
-                        pick = True
-
-                    if pick:
-                        # release previous best objects if any
+                    rows, desc_rows = ExcelReader._count_filled(grid)
+                    if ExcelReader._is_better(best, rows, desc_rows):
+                        # release previous best sheet if any
                         try:
-                            ComInterop.release(best["used_range"])
                             ComInterop.release(best["sheet"])
                         except Exception:
                             pass
                         best = {
                             "sheet": ws,
-                            "used_range": rng,
-                            "values": vals,
-                            "row_start": rs,
-                            "row_end": re,
-                            "col_start": cs,
-                            "col_end": ce,
+                            "grid": grid,
+                            "row_start": vals.GetLowerBound(0),
+                            "col_start": vals.GetLowerBound(1),
                             "rows": rows,
                             "desc_rows": desc_rows,
                         }
                     else:
-                        ComInterop.release(rng)
                         ComInterop.release(ws)
                 except Exception:
                     try:
@@ -336,138 +407,228 @@ class ExcelReader(object):
                         pass
 
             sheet = best["sheet"]
-            used_range = best["used_range"]
-            values = best["values"]
-
-            if values is None:
-                ExcelReader.LastDiagnostics = diag
-                return result
-
-            row_start = values.GetLowerBound(0)
-            row_end = values.GetUpperBound(0)
-            col_start = values.GetLowerBound(1)
-            col_end = values.GetUpperBound(1)
-            diag["row_start"] = row_start
-            diag["row_end"] = row_end
-            diag["col_start"] = col_start
-            diag["col_end"] = col_end
-            try:
-                diag["sheet"] = ComInterop.get(sheet, "Name")
-            except Exception:
-                diag["sheet"] = None
-            diag["sheet_rows"] = best.get("rows", 0)
-            diag["sheet_desc_rows"] = best.get("desc_rows", 0)
-
-            if row_end < row_start or col_end < col_start:
-                ExcelReader.LastDiagnostics = diag
-                return result
-
-            def safe_get(r, c):
-                if r < row_start or r > row_end or c < col_start or c > col_end:
-                    return None
+            sheet_name = None
+            if sheet is not None:
                 try:
-                    return values[r, c]
+                    sheet_name = ComInterop.get(sheet, "Name")
                 except Exception:
-                    return None
+                    sheet_name = None
 
-            def safe_get_text(r, c):
+            def get_text(r, c):
                 if sheet is None:
                     return None
                 return safe_get_sheet_text(sheet, r, c)
 
-            headers = {}
-            header_row = row_start
-            for col in range(col_start, col_end + 1):
-                header_val = safe_get(header_row, col)
-                if header_val is None:
-                    continue
-                header = ExcelReader._normalize_name(header_val)
-                if not header:
-                    continue
-                headers[header] = col
+            return ExcelReader._read_grid(best, sheet_name, get_text)
+        finally:
             try:
-                diag["headers"] = [h for h in headers.keys()]
-            except Exception:
-                diag["headers"] = []
+                if workbook is not None:
+                    ComInterop.call(workbook, "Close", False)
+            finally:
+                ComInterop.release(sheet)
+                ComInterop.release(worksheets)
+                ComInterop.release(workbook)
+                ComInterop.release(workbooks)
+                try:
+                    # the window is gone, so nothing else will quit Excel
+                    if ExcelReader._closed:
+                        ExcelReader.shutdown()
+                finally:
+                    ExcelReader._excel_lock.release()
 
-            file_col = None
-            for key in ("file", "file name", "filename", "file_name"):
-                if key in headers:
-                    file_col = headers.get(key)
-                    break
-            if file_col is None:
-                file_col = col_start
-
-            description_index = headers.get("description")
-            if description_index is None:
-                description_index = col_start + 1 if (col_start + 1) <= col_end else -1
-            diag["file_col"] = file_col
-            diag["description_index"] = description_index
-
-            for row in range(row_start + 1, row_end + 1):
-                file_val = safe_get(row, file_col)
-                if file_val is None or not str(file_val).strip():
-                    file_val = safe_get_text(row, file_col)
-                if file_val is None:
-                    continue
-                file_name = str(file_val).strip()
-                if not file_name:
+    @staticmethod
+    def _read_with_openpyxl(path):
+        # imported here so a button click only pays for it when reading a sheet;
+        # None sends read_excel on to Excel
+        try:
+            import openpyxl
+        except ImportError:
+            return None
+        if not ExcelReader._lxml_warned:
+            ExcelReader._lxml_warned = True
+            try:
+                import lxml  # noqa: F401  openpyxl streams read-only sheets much faster with it
+            except ImportError:
+                ExcelReader.PendingWarning = "lxml is not installed; openpyxl parsing is slower without it."
+
+        # encrypted, strict OOXML and other files openpyxl cannot read still
+        # open fine in Excel
+        try:
+            return ExcelReader._read_openpyxl_workbook(openpyxl, path)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _read_openpyxl_workbook(openpyxl, path):
+        # read-only mode holds the zip handle open until close()
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False)
+        try:
+            best = {
+                "sheet": None,
+                "grid": None,
+                "row_start": 1,
+                "col_start": 1,
+                "rows": 0,
+                "desc_rows": 0,
+            }
+            for ws in workbook.worksheets:
+                grid = [list(r) for r in ws.iter_rows(values_only=True)]
+                # iter_rows starts at A1; drop empty leading rows and columns
+                # so the grid starts where the COM path's UsedRange would
+                filled = [i for i, r in enumerate(grid) if any(v is not None for v in r)]
+                if not filled:
                     continue
+                top = filled[0]
+                left = min(
+                    next(j for j, v in enumerate(grid[i]) if v is not None)
+                    for i in filled
+                )
+                grid = [r[left:] for r in grid[top:]]
+                rows, desc_rows = ExcelReader._count_filled(grid)
+                if ExcelReader._is_better(best, rows, desc_rows):
+                    best["sheet"] = ws.title
+                    best["grid"] = grid
+                    best["row_start"] = top + 1
+                    best["col_start"] = left + 1
+                    best["rows"] = rows
+                    best["desc_rows"] = desc_rows
+            return ExcelReader._read_grid(best, best["sheet"], None)
+        finally:
+            workbook.close()
 
-                attributes = {}
-                for header, col in headers.items():
-                    if col == file_col:
-                        continue
-                    val = safe_get(row, col)
-                    if val is None or (isinstance(val, str) and not val.strip()):
-                        val = safe_get_text(row, col)
-                    if val is None:
-                        continue
-                    text_val = str(val).strip()
-                    if not text_val:
-                        continue
-                    attributes[header] = text_val
-
-                description = attributes.get("description", "")
-                if not description and description_index >= col_start and description_index <= col_end:
-                    desc_val = safe_get(row, description_index)
-                    if desc_val is None or (isinstance(desc_val, str) and not desc_val.strip()):
-                        desc_val = safe_get_text(row, description_index)
-                    if desc_val is not None:
-                        description = str(desc_val).strip()
-                        if description:
-                            attributes.setdefault("description", description)
+    @staticmethod
+    def _read_grid(best, sheet_name, get_text):
+        result = {}
+        diag = ExcelReader._new_diagnostics()
+        grid = best["grid"]
+        if not grid:
+            ExcelReader.LastDiagnostics = diag
+            return result
+
+        row_start = best["row_start"]
+        col_start = best["col_start"]
+        row_end = row_start + len(grid) - 1
+        col_end = col_start + max(len(r) for r in grid) - 1
+        diag["row_start"] = row_start
+        diag["row_end"] = row_end
+        diag["col_start"] = col_start
+        diag["col_end"] = col_end
+        diag["sheet"] = sheet_name
+        diag["sheet_rows"] = best.get("rows", 0)
+        diag["sheet_desc_rows"] = best.get("desc_rows", 0)
+
+        if row_end < row_start or col_end < col_start:
+            ExcelReader.LastDiagnostics = diag
+            return result
+
+        def safe_get(r, c):
+            if r < row_start or r > row_end or c < col_start or c > col_end:
+                return None
+            values_row = grid[r - row_start]
+            c -= col_start
+            return values_row[c] if c < len(values_row) else None
+
+        headers = {}
+        header_row = row_start
+        for col in range(col_start, col_end + 1):
+            header_val = safe_get(header_row, col)
+            if header_val is None:
+                continue
+            header = ExcelReader._normalize_name(header_val)
+            if not header:
+                continue
+            headers[header] = col
+        try:
+            diag["headers"] = [h for h in headers.keys()]
+        except Exception:
+            diag["headers"] = []
+
+        file_col = None
+        for key in ("file", "file name", "filename", "file_name"):
+            if key in headers:
+                file_col = headers.get(key)
+                break
+        if file_col is None:
+            file_col = col_start
+
+        description_index = headers.get("description")
+        if description_index is None:
+            description_index = col_start + 1 if (col_start + 1) <= col_end else -1
+        diag["file_col"] = file_col
+        diag["description_index"] = description_index
+
+        collect_diag = ExcelReader.DiagnosticsEnabled
+        rows_read = 0
+        unique_files = set()
+
+        def cell_value(r, c, text_fallback):
+            val = safe_get(r, c)
+            if text_fallback and (val is None or (isinstance(val, str) and not val.strip())):
+                val = get_text(r, c)
+            return val
+
+        for row in range(row_start + 1, row_end + 1):
+            # Value2 is authoritative; only fall back to the per-cell Text
+            # round-trip when the whole row came back empty.
+            text_fallback = get_text is not None and all(v is None for v in grid[row - row_start])
+
+            file_val = cell_value(row, file_col, text_fallback)
+            if file_val is None:
+                continue
+            file_name = str(file_val).strip()
+            if not file_name:
+                continue
 
+            attributes = {}
+            for header, col in headers.items():
+                if col == file_col:
+                    continue
+                val = cell_value(row, col, text_fallback)
+                if val is None:
+                    continue
+                text_val = str(val).strip()
+                if not text_val:
+                    continue
+                attributes[header] = text_val
+
+            description = attributes.get("description", "")
+            desc_val = None
+            if not description and description_index >= col_start and description_index <= col_end:
+                desc_val = cell_value(row, description_index, text_fallback)
+                if desc_val is not None:
+                    description = str(desc_val).strip()
+                    if description:
+                        attributes.setdefault("description", description)
+
+            if collect_diag:
                 try:
                     if len(diag["samples"]) < 5:
-                        diag["samples"].append((file_val, safe_get(row, description_index)))
+                        # the header column's value when there is one, else the raw cell
+                        diag["samples"].append((file_val, description or desc_val))
                 except Exception:
                     pass
 
-                row_obj = ExcelRow(file_name, description, attributes)
-                ExcelReader._add_result(result, ExcelReader._normalize_name(file_name), row_obj)
-                ExcelReader._add_result(result, ExcelReader._normalize_base(file_name), row_obj)
-                diag["rows_read"] = diag["rows_read"] + 1
+            row_obj = ExcelRow(file_name, description, attributes)
+            full = ExcelReader._normalize_name(file_name)
+            if full:
+                stored = result.setdefault(full, row_obj) is row_obj
+                base = full.rpartition(".")[0]
+                if base and base != full:
+                    stored = (result.setdefault(base, row_obj) is row_obj) or stored
+                if stored:
+                    unique_files.add(file_name)
+            rows_read += 1
+            if collect_diag:
                 try:
                     if len(diag["rows"]) < ExcelReader.MaxLogRows:
                         diag["rows"].append((file_name, description))
                 except Exception:
                     pass
 
-            ExcelReader.LastDiagnostics = diag
-            return result
-        finally:
-            if workbook is not None:
-                ComInterop.call(workbook, "Close", False)
-            if excel is not None:
-                ComInterop.call(excel, "Quit")
-
-            ComInterop.release(used_range)
-            ComInterop.release(sheet)
-            ComInterop.release(worksheets)
-            ComInterop.release(workbook)
-            ComInterop.release(workbooks)
-            ComInterop.release(excel)
+        diag["rows_read"] = rows_read
+        diag["unique_files"] = len(unique_files)
+        ExcelReader.LastDiagnostics = diag
+        return result
 
 
 class AccAuthSession(object):
@@ -490,14 +651,31 @@ class AccAuthSession(object):
 
 
 class AccAuthClient(object):
+    _SUCCESS_BYTES = Encoding.UTF8.GetBytes(
+        "<html><body><h3>You can close this window and return to Revit.</h3></body></html>"
+    )
+    _FAIL_BYTES = Encoding.UTF8.GetBytes(
+        "<html><body><h3>Authentication failed. You can close this window.</h3></body></html>"
+    )
+
     def __init__(self, authorize_url, token_url, redirect_uri, scopes, log):
         self._authorize_url = authorize_url
         self._token_url = token_url
         self._redirect_uri = redirect_uri
         self._scopes = scopes
         self._log = log
+        # everything except client_id and state is fixed for the session
+        self._auth_url_prefix = "{0}?response_type=code&redirect_uri={1}&scope={2}&prompt=login".format(
+            authorize_url,
+            Uri.EscapeDataString(redirect_uri),
+            Uri.EscapeDataString(scopes),
+        )
 
     def authenticate(self, client_id, client_secret, timeout_seconds=180):
+        # only needed for an interactive login; a cached token skips these
+        from System.Net import HttpListener
+        from System.Diagnostics import Process, ProcessStartInfo
+
         state = Guid.NewGuid().ToString("N")
         auth_url = self._build_auth_url(client_id, state)
 
@@ -554,15 +732,12 @@ class AccAuthClient(object):
         session.ExpiresAtUtc = updated.ExpiresAtUtc
 
     def _build_auth_url(self, client_id, state):
-        query = (
-            "response_type=code"
-            + "&client_id=" + Uri.EscapeDataString(client_id)
-            + "&redirect_uri=" + Uri.EscapeDataString(self._redirect_uri)
-            + "&scope=" + Uri.EscapeDataString(self._scopes)
-            + "&state=" + Uri.EscapeDataString(state)
-            + "&prompt=login"
+        # state is a hex Guid ("N" format) and never needs escaping
+        return "{0}&client_id={1}&state={2}".format(
+            self._auth_url_prefix,
+            Uri.EscapeDataString(client_id),
+            state,
         )
-        return self._authorize_url + "?" + query
 
     def _exchange_code(self, client_id, client_secret, code):
         form = {
@@ -584,17 +759,33 @@ class AccAuthClient(object):
         return Convert.ToBase64String(raw_bytes)
 
     def _write_response(self, response, error):
-        message = (
-            "You can close this window and return to Revit."
-            if not error
-            else "Authentication failed. You can close this window."
-        )
-        html = "<html><body><h3>{0}</h3></body></html>".format(message)
-        buffer = Encoding.UTF8.GetBytes(html)
+        buffer = AccAuthClient._FAIL_BYTES if error else AccAuthClient._SUCCESS_BYTES
         response.ContentLength64 = buffer.Length
         stream = response.OutputStream
-        stream.Write(buffer, 0, buffer.Length)
-        stream.Close()
+        try:
+            stream.Write(buffer, 0, buffer.Length)
+        finally:
+            stream.Close()
+
+
+# PATCH bodies have a fixed shape; only the json-escaped values vary
+_ITEM_DESCRIPTION_PATCH = (
+    '{{"jsonapi": {{"version": "1.0"}}, "data": {{"type": "items", "id": {id_json}, '
+    '"attributes": {{"extension": {{"data": {{"description": {desc_json}}}}}}}}}}}'
+)
+_ITEM_DISPLAY_NAME_PATCH = (
+    '{{"jsonapi": {{"version": "1.0"}}, "data": {{"type": "items", "id": {id_json}, '
+    '"attributes": {{"displayName": {name_json}}}}}}}'
+)
+_VERSION_DESCRIPTION_PATCH = (
+    '{{"jsonapi": {{"version": "1.0"}}, "data": {{"type": "versions", "id": {id_json}, '
+    '"attributes": {{"extension": {{"data": {{"description": {desc_json}}}}}}}}}}}'
+)
+_FMT_UPDATING = "Updating: {0} | type={1} | item_id={2} | {3}"
+
+
+def _truncate(text, limit=120):
+    return text if len(text) <= limit else text[:limit - 3] + "..."
 
 
 class AccDataClient(object):
@@ -602,14 +793,63 @@ class AccDataClient(object):
         self._auth_client = auth_client
         self._session = session
         self._log = log
+        self._token_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS)
+        # url -> (etag, body), oldest first; filled from disk on the pool so
+        # building a client never reads the file on the UI thread
+        self._etag_cache = {}
+        self._etag_cache_chars = 0
+        self._etag_lock = threading.Lock()
+        self._pool.submit(self._load_etag_cache)
+        # per-request PATCH lines are only logged when the window asks for them
+        self.verbose = False
+
+    def _load_etag_cache(self):
+        loaded = _load_etag_cache()
+        with self._etag_lock:
+            # anything fetched while the file was loading is newer
+            for url, entry in self._etag_cache.items():
+                loaded.pop(url, None)
+                loaded[url] = entry
+            self._etag_cache = loaded
+            self._etag_cache_chars = sum(len(entry[1] or "") for entry in loaded.values())
+            self._trim_etag_cache()
+
+    def _store_etag(self, url, etag, json_text):
+        with self._etag_lock:
+            old = self._etag_cache.pop(url, None)
+            if old is not None:
+                self._etag_cache_chars -= len(old[1] or "")
+            self._etag_cache[url] = (etag, json_text)
+            self._etag_cache_chars += len(json_text or "")
+            self._trim_etag_cache()
+
+    def _trim_etag_cache(self):
+        # caller holds _etag_lock; drops the oldest entries first
+        cache = self._etag_cache
+        while self._etag_cache_chars > ETAG_CACHE_MAX_CHARS and cache:
+            url = next(iter(cache))
+            self._etag_cache_chars -= len(cache.pop(url)[1] or "")
+
+    def save_etag_cache(self):
+        with self._etag_lock:
+            entries = list(self._etag_cache.items())
+        if entries:
+            self._pool.submit(_save_etag_cache, entries)
+
+    def close(self):
+        # queued work such as a pending cache save still runs; the idle
+        # threads exit once it is done
+        self._pool.shutdown(wait=False)
 
     def get_hubs(self):
         json_text = self._get("https://developer.api.autodesk.com/project/v1/hubs")
-        root = json.loads(json_text) if json_text else {}
+        root = _fast_loads(json_text) if json_text else {}
         result = []
-        for item in root.get("data", []):
-            attrs = item.get("attributes", {})
-            result.append(HubInfo(item.get("id", ""), attrs.get("name", "")))
+        append = result.append
+        for item in root.get("data") or ():
+            attrs = item.get("attributes") or {}
+            append(HubInfo(item.get("id", ""), attrs.get("name", "")))
         return result
 
     def get_projects(self, hub_id):
@@ -617,14 +857,11 @@ class AccDataClient(object):
             Uri.EscapeDataString(hub_id)
         )
         result = []
-        next_url = url
-        while next_url:
-            json_text = self._get(next_url)
-            root = json.loads(json_text) if json_text else {}
-            for item in root.get("data", []):
-                attrs = item.get("attributes", {})
-                result.append(ProjectInfo(item.get("id", ""), attrs.get("name", "")))
-            next_url = get_next_link(root)
+        append = result.append
+        for root in self._iter_pages(url):
+            for item in root.get("data") or ():
+                attrs = item.get("attributes") or {}
+                append(ProjectInfo(item.get("id", ""), attrs.get("name", "")))
         return result
 
     def get_top_folders(self, hub_id, project_id):
@@ -633,11 +870,12 @@ class AccDataClient(object):
             Uri.EscapeDataString(project_id),
         )
         json_text = self._get(url)
-        root = json.loads(json_text) if json_text else {}
+        root = _fast_loads(json_text) if json_text else {}
         result = []
-        for item in root.get("data", []):
-            attrs = item.get("attributes", {})
-            result.append(FolderNode(item.get("id", ""), attrs.get("displayName", "")))
+        append = result.append
+        for item in root.get("data") or ():
+            attrs = item.get("attributes") or {}
+            append(FolderNode(item.get("id", ""), attrs.get("displayName", "")))
         return result
 
     def get_folder_children(self, project_id, folder_id):
@@ -648,26 +886,54 @@ class AccDataClient(object):
             Uri.EscapeDataString(folder_id),
         )
         json_text = self._get(url)
-        root = json.loads(json_text) if json_text else {}
+        root = _fast_loads(json_text) if json_text else {}
         self._parse_folder_contents(root, children, files)
         return children
 
+    def get_folder_children_batch(self, project_id, folder_ids):
+        # refresh up front so the pool workers never race to refresh the
+        # token while the caller may be blocking the UI thread on the results
+        self._ensure_token()
+        futures = {}
+        for folder_id in folder_ids:
+            if folder_id and folder_id not in futures:
+                futures[folder_id] = self._pool.submit(self.get_folder_children, project_id, folder_id)
+        result = {}
+        for folder_id, future in futures.items():
+            result[folder_id] = future.result()
+        return result
+
     def get_files_in_folder(self, project_id, folder_id):
-        folders = []
         files = []
+        for page in self.iter_files_in_folder(project_id, folder_id):
+            files.extend(page)
+        return files
+
+    def iter_files_in_folder(self, project_id, folder_id):
+        """Yield the files of a folder one contents page at a time."""
         url = "https://developer.api.autodesk.com/data/v1/projects/{0}/folders/{1}/contents".format(
             Uri.EscapeDataString(project_id),
             Uri.EscapeDataString(folder_id),
         )
 
-        next_url = url
-        while next_url:
-            json_text = self._get(next_url)
-            root = json.loads(json_text) if json_text else {}
+        for root in self._iter_pages(url):
+            folders = []
+            files = []
             self._parse_folder_contents(root, folders, files)
-            next_url = get_next_link(root)
+            yield files
 
-        return files
+    def _iter_pages(self, url):
+        """Yield each page of a paged listing, fetching the next one on the
+        pool while the caller works through the current one."""
+        json_text = self._get(url)
+        while True:
+            root = _fast_loads(json_text) if json_text else {}
+            next_url = get_next_link(root)
+            pending = self._pool.submit(self._get, next_url) if next_url else None
+            yield root
+            if pending is None:
+                return
+            json_text = pending.result()
 
     def update_file_description(self, project_id, item_id, description):
         self._ensure_token()
@@ -676,35 +942,24 @@ class AccDataClient(object):
             Uri.EscapeDataString(item_id),
         )
 
-        body = json.dumps({
-            "jsonapi": {"version": "1.0"},
-            "data": {
-                "type": "items",
-                "id": item_id,
-                "attributes": {
-                    "extension": {
-                        "data": {
-                            "description": description,
-                        }
-                    }
-                },
-            },
-        })
+        body = _ITEM_DESCRIPTION_PATCH.format(
+            id_json=json.dumps(item_id),
+            desc_json=json.dumps(description),
+        )
 
         headers = {"Authorization": "Bearer " + self._session.AccessToken}
-        try:
-            desc_preview = description if description is not None else ""
-            if len(desc_preview) > 120:
-                desc_preview = desc_preview[:117] + "..."
-            self._log("PATCH item description: item_id={0} desc_len={1} desc='{2}'".format(
-                item_id,
-                len(description or ""),
-                desc_preview,
-            ))
-            self._log("PATCH url: {0}".format(url))
-            self._log("PATCH body: {0}".format(body))
-        except Exception:
-            pass
+        if self.verbose:
+            try:
+                desc_preview = _truncate(description or "")
+                self._log("PATCH item description: item_id={0} desc_len={1} desc='{2}'".format(
+                    item_id,
+                    len(description or ""),
+                    desc_preview,
+                ))
+                self._log("PATCH url: {0}".format(url))
+                self._log("PATCH body: {0}".format(body))
+            except Exception:
+                pass
         http_send("PATCH", url, body, "application/vnd.api+json", headers)
 
     def update_item_display_name(self, project_id, item_id, display_name):
@@ -714,31 +969,24 @@ class AccDataClient(object):
             Uri.EscapeDataString(item_id),
         )
 
-        body = json.dumps({
-            "jsonapi": {"version": "1.0"},
-            "data": {
-                "type": "items",
-                "id": item_id,
-                "attributes": {
-                    "displayName": display_name,
-                },
-            },
-        })
+        body = _ITEM_DISPLAY_NAME_PATCH.format(
+            id_json=json.dumps(item_id),
+            name_json=json.dumps(display_name),
+        )
 
         headers = {"Authorization": "Bearer " + self._session.AccessToken}
-        try:
-            name_preview = display_name if display_name is not None else ""
-            if len(name_preview) > 120:
-                name_preview = name_preview[:117] + "..."
-            self._log("PATCH item displayName: item_id={0} name_len={1} name='{2}'".format(
-                item_id,
-                len(display_name or ""),
-                name_preview,
-            ))
-            self._log("PATCH url: {0}".format(url))
-            self._log("PATCH body: {0}".format(body))
-        except Exception:
-            pass
+        if self.verbose:
+            try:
+                name_preview = _truncate(display_name or "")
+                self._log("PATCH item displayName: item_id={0} name_len={1} name='{2}'".format(
+                    item_id,
+                    len(display_name or ""),
+                    name_preview,
+                ))
+                self._log("PATCH url: {0}".format(url))
+                self._log("PATCH body: {0}".format(body))
+            except Exception:
+                pass
         http_send("PATCH", url, body, "application/vnd.api+json", headers)
 
     def update_version_description(self, project_id, version_id, description):
@@ -748,35 +996,24 @@ class AccDataClient(object):
             Uri.EscapeDataString(version_id),
         )
 
-        body = json.dumps({
-            "jsonapi": {"version": "1.0"},
-            "data": {
-                "type": "versions",
-                "id": version_id,
-                "attributes": {
-                    "extension": {
-                        "data": {
-                            "description": description,
-                        }
-                    }
-                },
-            },
-        })
+        body = _VERSION_DESCRIPTION_PATCH.format(
+            id_json=json.dumps(version_id),
+            desc_json=json.dumps(description),
+        )
 
         headers = {"Authorization": "Bearer " + self._session.AccessToken}
-        try:
-            desc_preview = description if description is not None else ""
-            if len(desc_preview) > 120:
-                desc_preview = desc_preview[:117] + "..."
-            self._log("PATCH version description: version_id={0} desc_len={1} desc='{2}'".format(
-                version_id,
-                len(description or ""),
-                desc_preview,
-            ))
-            self._log("PATCH url: {0}".format(url))
-            self._log("PATCH body: {0}".format(body))
-        except Exception:
-            pass
+        if self.verbose:
+            try:
+                desc_preview = _truncate(description or "")
+                self._log("PATCH version description: version_id={0} desc_len={1} desc='{2}'".format(
+                    version_id,
+                    len(description or ""),
+                    desc_preview,
+                ))
+                self._log("PATCH url: {0}".format(url))
+                self._log("PATCH body: {0}".format(body))
+            except Exception:
+                pass
         http_send("PATCH", url, body, "application/vnd.api+json", headers)
 
     @staticmethod
@@ -823,7 +1060,18 @@ class AccDataClient(object):
     def _get(self, url):
         self._ensure_token()
         headers = {"Authorization": "Bearer " + self._session.AccessToken}
-        return http_send("GET", url, None, "application/json", headers)
+        with self._etag_lock:
+            cached = self._etag_cache.get(url)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+        response_info = {}
+        json_text = http_send("GET", url, None, "application/json", headers, response_info)
+        if cached and response_info.get("status") == 304:
+            return cached[1]
+        etag = response_info.get("etag")
+        if etag:
+            self._store_etag(url, etag, json_text)
+        return json_text
 
     def get_item_detail(self, project_id, item_id):
         self._ensure_token()
@@ -834,31 +1082,37 @@ class AccDataClient(object):
         return self._get(url)
 
     def _ensure_token(self):
-        if self._session.ExpiresAtUtc <= DateTime.UtcNow.AddMinutes(2):
-            self._log("Refreshing token...")
-            self._auth_client.refresh(self._session.ClientId, self._session.ClientSecret, self._session)
+        with self._token_lock:
+            if self._session.ExpiresAtUtc <= DateTime.UtcNow.AddMinutes(2):
+                self._log("Refreshing token...")
+                self._auth_client.refresh(self._session.ClientId, self._session.ClientSecret, self._session)
 
     def _parse_folder_contents(self, root, folders, files):
-        for item in root.get("data", []):
-            item_type = item.get("type", "")
-            attrs = item.get("attributes", {})
-
-            if item_type.lower() == "folders":
-                folders.append(FolderNode(item.get("id", ""), attrs.get("displayName", "")))
-            elif item_type.lower() == "items":
-                ext = attrs.get("extension", {})
-                ext_type = ext.get("type", "")
-                can_update = True
-                files.append(FileItem(
+        folders_append = folders.append
+        files_append = files.append
+        for item in root.get("data") or ():
+            item_type = (item.get("type") or "").lower()
+            attrs = item.get("attributes") or {}
+
+            if item_type == "folders":
+                folders_append(FolderNode(item.get("id", ""), attrs.get("displayName", "")))
+            elif item_type == "items":
+                ext = attrs.get("extension") or {}
+                # the listing already names each item's tip version
+                tip = ((item.get("relationships") or {}).get("tip") or {}).get("data") or {}
+                files_append(FileItem(
                     item.get("id", ""),
                     attrs.get("displayName", ""),
                     attrs.get("description", ""),
-                    ext_type,
-                    can_update,
+                    ext.get("type", ""),
+                    True,
+                    tip.get("id") or None,
                 ))
 
 
 class HubInfo(object):
+    __slots__ = ("Id", "Name")
+
     def __init__(self, hub_id, name):
         self.Id = hub_id
         self.Name = name
@@ -867,48 +1121,108 @@ class HubInfo(object):
 
 
 class ProjectInfo(object):
+    __slots__ = ("Id", "Name", "_sort_key")
+
     def __init__(self, project_id, name):
         self.Id = project_id
         self.Name = name
+        self._sort_key = (name or "").lower()
     def __str__(self):
         return self.Name
 
 
+_PROJECT_SORT_KEY = operator.attrgetter("_sort_key")
+
+
+_BULK_MEMBERS = {}
+
+
+def _bulk_members(col_type):
+    members = _BULK_MEMBERS.get(col_type)
+    if members is None:
+        flags = BindingFlags.Instance | BindingFlags.NonPublic
+        items_prop = col_type.GetProperty("Items", flags)
+        on_changed = col_type.GetMethod(
+            "OnCollectionChanged", flags, None,
+            Array[Type]([NotifyCollectionChangedEventArgs]), None,
+        )
+        on_prop = col_type.GetMethod(
+            "OnPropertyChanged", flags, None,
+            Array[Type]([PropertyChangedEventArgs]), None,
+        )
+        members = (items_prop, on_changed, on_prop)
+        _BULK_MEMBERS[col_type] = members
+    return members
+
+
+def _bulk_replace(collection, items):
+    """Replace the contents of an ObservableCollection with one Reset event."""
+    try:
+        items_prop, on_changed, on_prop = _bulk_members(collection.GetType())
+        backing = items_prop.GetValue(collection)
+        backing.Clear()
+        for item in items:
+            backing.Add(item)
+        on_prop.Invoke(collection, Array[Object]([PropertyChangedEventArgs("Count")]))
+        on_prop.Invoke(collection, Array[Object]([PropertyChangedEventArgs("Item[]")]))
+        on_changed.Invoke(collection, Array[Object]([
+            NotifyCollectionChangedEventArgs(NotifyCollectionChangedAction.Reset)
+        ]))
+    except Exception:
+        # reflection unavailable; fall back to per-item notifications
+        collection.Clear()
+        for item in items:
+            collection.Add(item)
+
+
 class FolderNode(object):
+    __slots__ = ("Id", "Name", "IsPlaceholder", "IsUpLevel", "IsLoaded", "IsLoading", "_children")
+
     def __init__(self, folder_id, name, is_placeholder=False, is_up_level=False):
         self.Id = folder_id
         self.Name = name
         self.IsPlaceholder = is_placeholder
         self.IsUpLevel = is_up_level
-        self.Children = ObservableCollection[Object]()
         self.IsLoaded = False
         self.IsLoading = False
-        if not is_placeholder and not is_up_level:
-            self.Children.Add(FolderNode("", "", True))
+        self._children = None
+
+    @property
+    def Children(self):
+        # created on first access (when WPF realizes the row) so unseen
+        # folders cost no .NET collection or placeholder node
+        if self._children is None:
+            self._children = ObservableCollection[Object]()
+            if not self.IsPlaceholder and not self.IsUpLevel:
+                self._children.Add(_PLACEHOLDER)
+        return self._children
+
+
+_PLACEHOLDER = FolderNode("", "", True)
 
 
 class FileItem(object):
-    def __init__(self, item_id, display_name, description, ext_type, can_update):
+    __slots__ = ("Id", "DisplayName", "Description", "ExtensionType", "CanUpdateDescription", "TipId")
+
+    def __init__(self, item_id, display_name, description, ext_type, can_update, tip_id=None):
         self.Id = item_id
         self.DisplayName = display_name
         self.Description = description
         self.ExtensionType = ext_type
         self.CanUpdateDescription = can_update
+        self.TipId = tip_id
 
 
 def load_window():
+    from System.Windows.Markup import XamlReader
+
     xaml_path = os.path.join(os.path.dirname(__file__), "ui.xaml")
     if not os.path.exists(xaml_path):
         UI.TaskDialog.Show(TITLE, "ui.xaml not found. Ensure ui.xaml is next to script.py.")
         return None
-
-    stream = None
-    try:
-        stream = FileStream(xaml_path, FileMode.Open, FileAccess.Read)
-        return XamlReader.Load(stream)
-    finally:
-        if stream is not None:
-            stream.Close()
+    # utf-8-sig drops the BOM, which XamlReader.Parse would reject
+    with open(xaml_path, "r", encoding="utf-8-sig") as fh:
+        return XamlReader.Parse(fh.read())
 
 
 class AccDocsWindow(object):
@@ -934,8 +1248,16 @@ class AccDocsWindow(object):
         self.browse_excel_button = self._window.FindName("BrowseExcelButton")
         self.apply_button = self._window.FindName("ApplyButton")
         self.log_box = self._window.FindName("LogBox")
+        self.verbose_log_check = self._window.FindName("VerboseLogCheck")
         self.status_text = self._window.FindName("StatusText")
 
+        # log() only queues; the timer appends whatever is pending in one go
+        self._log_queue = deque()
+        self._log_timer = DispatcherTimer()
+        self._log_timer.Interval = TimeSpan.FromMilliseconds(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.Tick += self._flush_log
+        self._log_timer.Start()
+
         self.redirect_uri_box.Text = REDIRECT_URI
 
         self.hub_combo.IsEnabled = False
@@ -947,7 +1269,10 @@ class AccDocsWindow(object):
 
         self._folder_nodes = ObservableCollection[Object]()
         self._file_items = ObservableCollection[Object]()
+        # parent folder ids of the levels above the one shown; None is the top
         self._folder_nav_stack = []
+        self._current_parent_id = None
+        self._top_folders = []
         self.folder_tree.ItemsSource = self._folder_nodes
         self.file_list.ItemsSource = self._file_items
 
@@ -955,11 +1280,28 @@ class AccDocsWindow(object):
         self._auth_client = None
         self._data_client = None
         self._excel_rows = None
+        self._excel_loading = False
+        self._applying = False
+        # set when the window closes mid-run; queued files are then left alone
+        self._apply_cancelled = False
+        # per-file "Updating:" and PATCH lines; off keeps large runs quiet
+        self._verbose = False
         self._auth_in_progress = False
         self._last_selected_folder_id = None
         self._active_folder_id = None
+        self._files_load_id = 0
+        # True while file pages are still arriving; Apply would miss the rest
+        self._files_loading = False
         self._custom_attr_defs = None
         self._custom_attr_defs_folder_id = None
+        self._custom_attr_defs_lock = threading.Lock()
+        # (project_id, item_id) -> tip version id from a detail GET
+        self._item_detail_cache = {}
+        # (kind, project_id, folder_id) -> (expires_at, result)
+        self._tree_cache = {}
+        # cache key -> Future of a fetch that is still running
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
         self._config = pyrevit_script.get_config()
 
         self.login_button.Click += self.on_sign_in
@@ -975,9 +1317,21 @@ class AccDocsWindow(object):
         self.apply_button.Click += self.on_apply_descriptions
         if self.load_folder_button:
             self.load_folder_button.Click += self.on_load_folder_url
+        if self.verbose_log_check:
+            self.verbose_log_check.Checked += self.on_verbose_log_changed
+            self.verbose_log_check.Unchecked += self.on_verbose_log_changed
 
         self.log("Ready.")
 
+        # runs once the dialog's message loop starts, after the first render
+        self._window.Dispatcher.BeginInvoke(DispatcherPriority.Background, Action(self._restore_startup_state))
+
+        try:
+            self._window.Closing += self.on_window_closing
+        except Exception:
+            pass
+
+    def _restore_startup_state(self):
         try:
             creds = _get_env_credentials()
             loaded_any = False
@@ -992,17 +1346,13 @@ class AccDocsWindow(object):
         except Exception:
             pass
 
+        # the cached session reads the credential boxes filled above
         try:
             self._restore_cached_inputs()
             self._restore_cached_session()
         except Exception:
             pass
 
-        try:
-            self._window.Closing += self.on_window_closing
-        except Exception:
-            pass
-
     def _as_collection(self, items):
         col = ObservableCollection[Object]()
         if items:
@@ -1010,12 +1360,27 @@ class AccDocsWindow(object):
                 col.Add(item)
         return col
 
+    def _set_folder_nodes(self, items):
+        # build the collection unbound and swap it in, so the TreeView
+        # lays out once instead of once per added folder
+        self._folder_nodes = self._as_collection(items)
+        self.folder_tree.ItemsSource = self._folder_nodes
+
     def show(self):
         if self._window is None:
             return
         self._window.ShowDialog()
 
     def on_window_closing(self, sender, args):
+        if self._applying:
+            answer = MessageBox.Show(
+                "An update is still running. Close anyway? Files not updated yet will be left unchanged.",
+                TITLE, MessageBoxButton.YesNo, MessageBoxImage.Warning,
+            )
+            if answer != MessageBoxResult.Yes:
+                args.Cancel = True
+                return
+            self._apply_cancelled = True
         try:
             if self.folder_url_box and self.folder_url_box.Text:
                 self._config.last_folder_url = self.folder_url_box.Text
@@ -1024,6 +1389,17 @@ class AccDocsWindow(object):
             pyrevit_script.save_config()
         except Exception:
             pass
+        self._log_timer.Stop()
+        self._set_data_client(None)
+        ExcelReader.shutdown()
+
+    def _set_data_client(self, data_client):
+        # the replaced client saves its ETag cache and releases its pool threads
+        old = self._data_client
+        self._data_client = data_client
+        if old is not None and old is not data_client:
+            old.save_etag_cache()
+            old.close()
 
     def _restore_cached_inputs(self):
         try:
@@ -1038,23 +1414,61 @@ class AccDocsWindow(object):
             if last_excel_path and self.excel_path_box:
                 self.excel_path_box.Text = last_excel_path
                 if os.path.exists(last_excel_path):
-                    try:
-                        self._excel_rows = ExcelReader.read_excel(last_excel_path)
-                        unique_rows = set()
-                        try:
-                            unique_rows = set([x.FileName for x in self._excel_rows.values() if x])
-                        except Exception:
-                            unique_rows = set()
-                        self.excel_status_text.Text = "Loaded {0} rows from Excel (case-insensitive; extension optional).".format(len(unique_rows))
-                        self.log("Excel loaded: {0}".format(last_excel_path))
-                        self._log_excel_diagnostics()
-                    except Exception as ex:
-                        self._excel_rows = None
-                        self.excel_status_text.Text = "Excel load failed."
-                        self.log("Excel load failed: {0}".format(ex))
+                    self._load_excel_async(last_excel_path)
         except Exception:
             pass
 
+    def _load_excel_async(self, path, remember_path=False):
+        self._excel_loading = True
+        self._update_action_buttons()
+        self.excel_status_text.Text = "Loading Excel..."
+
+        def worker():
+            try:
+                rows = _load_excel_cached(path)
+                diag = ExcelReader.LastDiagnostics or {}
+                count = diag.get("unique_files", len(rows))
+
+                def ui_done():
+                    self._excel_rows = rows
+                    self.excel_status_text.Text = "Loaded {0} rows from Excel (case-insensitive; extension optional).".format(count)
+                    self.log("Excel loaded: {0}".format(path))
+                    self._log_excel_diagnostics()
+                    if remember_path:
+                        try:
+                            self._config.last_excel_path = path
+                            pyrevit_script.save_config()
+                        except Exception:
+                            pass
+                    self._end_excel_load()
+                self._window.Dispatcher.Invoke(Action(ui_done))
+            except Exception as ex:
+                def ui_fail():
+                    self._excel_rows = None
+                    self.excel_status_text.Text = "Excel load failed."
+                    self.log("Excel load failed: {0}".format(ex))
+                    self._end_excel_load()
+                self._window.Dispatcher.Invoke(Action(ui_fail))
+
+        t = Thread(ThreadStart(worker))
+        t.IsBackground = True
+        t.Start()
+
+    def _end_excel_load(self):
+        self._excel_loading = False
+        self._update_action_buttons()
+
+    def _update_action_buttons(self):
+        # Browse and Apply are only usable once signed in and while no Excel
+        # load or update is running; every path that enables them comes here
+        idle = self._data_client is not None and not self._excel_loading and not self._applying
+        self.browse_excel_button.IsEnabled = idle
+        self.apply_button.IsEnabled = idle and not self._files_loading
+
+    def _set_files_loading(self, loading):
+        self._files_loading = loading
+        self._update_action_buttons()
+
     def _restore_cached_session(self):
         try:
             token = getattr(self._config, "acc_token", None)
@@ -1067,8 +1481,7 @@ class AccDocsWindow(object):
             except Exception:
                 return
 
-            expires_at = DateTime(expires_ticks)
-            if expires_at <= DateTime.UtcNow.AddMinutes(2):
+            if expires_ticks <= DateTime.UtcNow.Ticks + TOKEN_EXPIRY_MARGIN_TICKS:
                 try:
                     self._config.acc_token = None
                     self._config.acc_token_expires = None
@@ -1079,16 +1492,17 @@ class AccDocsWindow(object):
 
             session = AccAuthSession()
             session.AccessToken = token
-            session.ExpiresAtUtc = expires_at
+            session.ExpiresAtUtc = DateTime(expires_ticks)
             session.ClientId = (self.client_id_box.Text or "").strip()
             session.ClientSecret = (self.client_secret_box.Password or "").strip()
 
             auth_client = AccAuthClient(OAUTH_AUTHORIZE_URL, OAUTH_TOKEN_URL, REDIRECT_URI, DEFAULT_SCOPES, self.log)
             data_client = AccDataClient(auth_client, session, self.log)
+            data_client.verbose = self._verbose
 
             self._auth_client = auth_client
             self._session = session
-            self._data_client = data_client
+            self._set_data_client(data_client)
 
             self.status_text.Text = "Signed in (cached)"
             self.log("Using cached token.")
@@ -1096,8 +1510,7 @@ class AccDocsWindow(object):
             self.project_combo.IsEnabled = True
             self.folder_tree.IsEnabled = True
             self.refresh_folders_button.IsEnabled = True
-            self.browse_excel_button.IsEnabled = True
-            self.apply_button.IsEnabled = True
+            self._update_action_buttons()
 
             self._load_hubs_async()
         except Exception:
@@ -1130,8 +1543,10 @@ class AccDocsWindow(object):
         diag = ExcelReader.LastDiagnostics
         if not diag:
             return
+        # collect the whole block and append it to the log box in one go
+        buf = []
         try:
-            self.log("Excel diagnostics: range R{0}-R{1}, C{2}-C{3}, file_col={4}, desc_col={5}, rows={6}".format(
+            buf.append("Excel diagnostics: range R{0}-R{1}, C{2}-C{3}, file_col={4}, desc_col={5}, rows={6}".format(
                 diag.get("row_start"),
                 diag.get("row_end"),
                 diag.get("col_start"),
@@ -1145,7 +1560,7 @@ class AccDocsWindow(object):
         try:
             sheet_name = diag.get("sheet")
             if sheet_name:
-                self.log("Excel sheet: {0} (rows={1}, desc_rows={2})".format(
+                buf.append("Excel sheet: {0} (rows={1}, desc_rows={2})".format(
                     sheet_name,
                     diag.get("sheet_rows"),
                     diag.get("sheet_desc_rows"),
@@ -1155,9 +1570,21 @@ class AccDocsWindow(object):
         try:
             headers = diag.get("headers") or []
             if headers:
-                self.log("Excel headers (row 1): {0}".format(", ".join(headers)))
+                buf.append("Excel headers (row 1): {0}".format(", ".join(headers)))
+        except Exception:
+            pass
+        # samples and rows are only filled when WWP_EXCEL_DIAG is set
+        try:
+            for file_val, desc_val in diag.get("samples") or ():
+                buf.append("Excel sample: file='{0}' desc='{1}'".format(file_val, desc_val))
+            for file_name, description in diag.get("rows") or ():
+                buf.append("Excel row: '{0}' -> '{1}'".format(file_name, description))
         except Exception:
             pass
+        if ExcelReader.PendingWarning:
+            buf.append("Excel warning: {0}".format(ExcelReader.PendingWarning))
+            ExcelReader.PendingWarning = None
+        self._log_lines(buf)
 
     def _get_active_folder_id(self):
         try:
@@ -1170,7 +1597,7 @@ class AccDocsWindow(object):
             return self._active_folder_id
         return None
 
-    def _get_custom_attribute_definitions(self, project_id, folder_id):
+    def _get_custom_attribute_definitions(self, data_client, project_id, folder_id):
         if not folder_id:
             return {}
         if self._custom_attr_defs_folder_id == folder_id and self._custom_attr_defs is not None:
@@ -1178,7 +1605,7 @@ class AccDocsWindow(object):
 
         defs_map = {}
         try:
-            json_text = self._data_client.get_custom_attribute_definitions(project_id, folder_id)
+            json_text = data_client.get_custom_attribute_definitions(project_id, folder_id)
             root = json.loads(json_text) if json_text else {}
             if isinstance(root, list):
                 defs = root
@@ -1230,18 +1657,20 @@ class AccDocsWindow(object):
         self.status_text.Text = "Signing in..."
 
         def worker():
+            data_client = None
             try:
                 auth_client = AccAuthClient(OAUTH_AUTHORIZE_URL, OAUTH_TOKEN_URL, REDIRECT_URI, DEFAULT_SCOPES, self.log)
                 session = auth_client.authenticate(client_id, client_secret)
                 session.ClientId = client_id
                 session.ClientSecret = client_secret
                 data_client = AccDataClient(auth_client, session, self.log)
+                data_client.verbose = self._verbose
                 hubs = data_client.get_hubs()
 
                 def ui_success():
                     self._auth_client = auth_client
                     self._session = session
-                    self._data_client = data_client
+                    self._set_data_client(data_client)
 
                     self.status_text.Text = "Signed in"
                     self.log("Signed in successfully.")
@@ -1249,8 +1678,7 @@ class AccDocsWindow(object):
                     self.project_combo.IsEnabled = True
                     self.folder_tree.IsEnabled = True
                     self.refresh_folders_button.IsEnabled = True
-                    self.browse_excel_button.IsEnabled = True
-                    self.apply_button.IsEnabled = True
+                    self._update_action_buttons()
 
                     self.hub_combo.ItemsSource = self._as_collection(hubs)
                     self.hub_combo.DisplayMemberPath = "Name"
@@ -1271,6 +1699,9 @@ class AccDocsWindow(object):
 
                 self._window.Dispatcher.Invoke(Action(ui_success))
             except Exception as ex:
+                if data_client is not None:
+                    data_client.close()
+
                 def ui_fail():
                     self.status_text.Text = "Sign in failed"
                     self.log("Sign in failed: {0}".format(ex))
@@ -1305,7 +1736,7 @@ class AccDocsWindow(object):
             self.status_text.Text = "Loading projects..."
             projects = self._data_client.get_projects(hub.Id)
             try:
-                projects = sorted(projects, key=lambda p: (p.Name or "").lower())
+                projects = sorted(projects, key=_PROJECT_SORT_KEY)
             except Exception:
                 pass
             self.project_combo.ItemsSource = self._as_collection(projects)
@@ -1330,32 +1761,27 @@ class AccDocsWindow(object):
         try:
             self.status_text.Text = "Loading folders..."
             self._folder_nodes.Clear()
+            # drop any file load still streaming pages for the old project
+            self._files_load_id += 1
             self._file_items.Clear()
+            self._set_files_loading(False)
             self._folder_nav_stack = []
+            self._current_parent_id = None
+            self._top_folders = []
             self._last_selected_folder_id = None
 
             top_folders = self._data_client.get_top_folders(hub.Id, project.Id)
-            for folder in top_folders:
-                try:
-                    if folder.Children is not None and folder.Children.Count == 0:
-                        folder.Children.Add(FolderNode("", "", True))
-                except Exception:
-                    pass
-                self._folder_nodes.Add(folder)
-                try:
-                    count = folder.Children.Count if folder.Children is not None else 0
-                    self.log("Top folder '{0}' children={1}".format(folder.Name, count))
-                except Exception:
-                    pass
-
-            # Auto-expand Project Files if available
-            for folder in top_folders:
-                try:
-                    if folder.Name and folder.Name.lower() == "project files":
-                        self._expand_folder_node(project.Id, folder)
-                        break
-                except Exception:
-                    continue
+            # Children always exists and starts with the placeholder
+            self._log_lines([
+                "Top folder '{0}' children={1}".format(folder.Name, folder.Children.Count)
+                for folder in top_folders
+            ])
+
+            # Fetch every top folder's children in one parallel batch; this
+            # also covers the Project Files auto-expand.
+            self._prefetch_children(project.Id, top_folders)
+            self._top_folders = top_folders
+            self._set_folder_nodes(top_folders)
 
             self.status_text.Text = "Folders loaded"
         except Exception as ex:
@@ -1376,23 +1802,39 @@ class AccDocsWindow(object):
             self.log("Loading subfolders for '{0}'...".format(node.Name))
             node.IsLoading = True
             self._expand_folder_node(project.Id, node)
-            try:
-                count = node.Children.Count if node.Children is not None else 0
-                self.log("Loaded {0} subfolder(s) under '{1}'.".format(count, node.Name))
-            except Exception:
-                pass
+            self.log("Loaded {0} subfolder(s) under '{1}'.".format(node.Children.Count, node.Name))
         except Exception as ex:
             self.log("Failed to expand folder: {0}".format(ex))
         finally:
             node.IsLoading = False
 
     def _expand_folder_node(self, project_id, node):
-        children = self._data_client.get_folder_children(project_id, node.Id)
-        node.Children.Clear()
-        for child in children:
-            node.Children.Add(child)
+        children = self._cached_fetch("children", project_id, node.Id, self._data_client.get_folder_children)
+        self._fill_children(node, children)
+
+    def _fill_children(self, node, children):
+        _bulk_replace(node.Children, children)
         node.IsLoaded = True
 
+    def _prefetch_children(self, project_id, nodes):
+        pending = [n for n in nodes if n.Id and ("children", project_id, n.Id) not in self._tree_cache]
+        try:
+            fetched = self._data_client.get_folder_children_batch(project_id, [n.Id for n in pending])
+        except Exception as ex:
+            # folders still expand lazily one at a time
+            self.log("Folder prefetch failed: {0}".format(ex))
+            return
+        expires = time.monotonic() + TREE_CACHE_TTL_SECONDS
+        for node in pending:
+            children = fetched.get(node.Id)
+            if children is None:
+                continue
+            self._tree_cache[("children", project_id, node.Id)] = (expires, children)
+            try:
+                self._fill_children(node, children)
+            except Exception:
+                pass
+
     def on_folder_selected(self, sender, args):
         node = args.NewValue
         if node is None:
@@ -1405,16 +1847,9 @@ class AccDocsWindow(object):
             return
 
         try:
-            try:
-                count = node.Children.Count if node.Children is not None else 0
-                self.log("Folder selected '{0}' children={1}".format(node.Name, count))
-            except Exception:
-                pass
+            self.log("Folder selected '{0}' children={1}".format(node.Name, node.Children.Count))
             if self._last_selected_folder_id == node.Id:
-                try:
-                    self.log("Reselected same folder; refreshing files.")
-                except Exception:
-                    pass
+                self.log("Reselected same folder; refreshing files.")
             self._last_selected_folder_id = node.Id
             self._load_files_for_folder(project.Id, node)
         except Exception as ex:
@@ -1428,62 +1863,105 @@ class AccDocsWindow(object):
             node = None
         if node is None:
             return
+        project = self.project_combo.SelectedItem
         if getattr(node, "IsUpLevel", False):
             try:
-                if self._folder_nav_stack:
-                    previous = self._folder_nav_stack.pop()
-                    self._folder_nodes.Clear()
-                    for item in previous:
-                        self._folder_nodes.Add(item)
+                if self._folder_nav_stack and project is not None:
+                    self._show_folder_level(project.Id, self._folder_nav_stack.pop())
                     self.status_text.Text = "Folders loaded"
                     self.log("Returned to previous folder level.")
             except Exception as ex:
                 self.log("Failed to return to previous level: {0}".format(ex))
             return
 
-        project = self.project_combo.SelectedItem
         if project is None:
             return
 
         try:
             self.log("Double-clicked folder '{0}' - loading subfolders...".format(node.Name))
-        except Exception:
-            pass
-
-        try:
             if not node.IsLoaded:
                 self._expand_folder_node(project.Id, node)
-            try:
-                children = [c for c in node.Children if not getattr(c, "IsPlaceholder", False)]
-            except Exception:
-                children = []
-            try:
-                self.log("Loaded {0} subfolder(s) under '{1}'.".format(len(children), node.Name))
-            except Exception:
-                pass
+            children = [c for c in node.Children if not c.IsPlaceholder]
+            self.log("Loaded {0} subfolder(s) under '{1}'.".format(len(children), node.Name))
             if children:
-                try:
-                    self._folder_nav_stack.append(list(self._folder_nodes))
-                    self._folder_nodes.Clear()
-                    up = FolderNode("", "..", False, True)
-                    try:
-                        up.Children.Clear()
-                    except Exception:
-                        pass
-                    self._folder_nodes.Add(up)
-                    for child in children:
-                        self._folder_nodes.Add(child)
-                    self.status_text.Text = "Folders loaded"
-                except Exception as ex:
-                    self.log("Failed to show subfolders for '{0}': {1}".format(getattr(node, "Name", ""), ex))
+                self._folder_nav_stack.append(self._current_parent_id)
+                self._current_parent_id = node.Id
+                # the up-level node never gets a placeholder child
+                self._set_folder_nodes([FolderNode("", "..", False, True)] + children)
+                self.status_text.Text = "Folders loaded"
             else:
                 self.log("No subfolders under '{0}'.".format(getattr(node, "Name", "")))
         except Exception as ex:
             self.log("Failed to load subfolders for '{0}': {1}".format(getattr(node, "Name", ""), ex))
 
+    def _show_folder_level(self, project_id, parent_id):
+        # rebuild a level from the tree cache rather than a stored snapshot
+        self._current_parent_id = parent_id
+        if parent_id is None:
+            self._set_folder_nodes(self._top_folders)
+            return
+        children = self._cached_fetch("children", project_id, parent_id, self._data_client.get_folder_children)
+        self._set_folder_nodes([FolderNode("", "..", False, True)] + list(children))
+
+    def _cached_fetch(self, kind, project_id, folder_id, fetch):
+        key = (kind, project_id, folder_id)
+        entry = self._tree_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        future, owner = self._claim_fetch(key)
+        if not owner:
+            # a worker waits for the running fetch; the UI thread must not
+            # block on one that may itself be waiting on the dispatcher
+            if not self._window.Dispatcher.CheckAccess():
+                return future.result()
+            return fetch(project_id, folder_id)
+
+        try:
+            result = fetch(project_id, folder_id)
+        except Exception as ex:
+            self._finish_fetch(key, future, error=ex)
+            raise
+        self._tree_cache[key] = (time.monotonic() + TREE_CACHE_TTL_SECONDS, result)
+        self._finish_fetch(key, future, result)
+        return result
+
+    def _claim_fetch(self, key):
+        """Return (future, owner); the owner fetches and calls _finish_fetch."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = self._inflight[key] = Future()
+            return future, True
+
+    def _finish_fetch(self, key, future, result=None, error=None):
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _invalidate_tree_cache(self, kind, project_id=None, folder_id=None):
+        for key in list(self._tree_cache.keys()):
+            if key[0] != kind:
+                continue
+            if project_id is not None and key[1] != project_id:
+                continue
+            if folder_id is not None and key[2] != folder_id:
+                continue
+            self._tree_cache.pop(key, None)
+
     def on_refresh_folders(self, sender, args):
+        self._invalidate_tree_cache("children")
         self.load_top_folders()
 
+    def on_verbose_log_changed(self, sender, args):
+        self._verbose = bool(self.verbose_log_check.IsChecked)
+        if self._data_client is not None:
+            self._data_client.verbose = self._verbose
+
     def on_refresh_files(self, sender, args):
         project = self.project_combo.SelectedItem
         if project is None:
@@ -1498,37 +1976,92 @@ class AccDocsWindow(object):
             self.log("Refreshing files for '{0}'...".format(node.Name))
         except Exception:
             pass
+        self._invalidate_tree_cache("files", project.Id, node.Id)
         self._load_files_for_folder(project.Id, node)
 
+    def _show_files_status(self, files):
+        if files:
+            self.status_text.Text = "Files loaded"
+        else:
+            self.status_text.Text = "No files in this folder. Select a subfolder."
+
     def _load_files_for_folder(self, project_id, node):
-        try:
-            self._active_folder_id = node.Id
-            self.status_text.Text = "Loading files..."
-            self._file_items.Clear()
-            files = self._data_client.get_files_in_folder(project_id, node.Id)
-            for item in files:
-                self._file_items.Add(item)
-            if files:
-                self.status_text.Text = "Files loaded"
+        # a newer load (or a URL load) makes this one's pages stale
+        self._files_load_id += 1
+        load_id = self._files_load_id
+        self._active_folder_id = node.Id
+        folder_id = node.Id
+        key = ("files", project_id, folder_id)
+        entry = self._tree_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            _bulk_replace(self._file_items, entry[1])
+            self._show_files_status(entry[1])
+            self._set_files_loading(False)
+            return
+
+        self.status_text.Text = "Loading files..."
+        self._file_items.Clear()
+        self._set_files_loading(True)
+
+        def worker():
+            # a folder reselected, refreshed or loaded by URL while this
+            # listing is still in flight shares the one running fetch
+            future, owner = self._claim_fetch(key)
+            files = []
+            error = None
+            try:
+                if owner:
+                    # show each contents page as soon as it arrives
+                    pages = self._data_client.iter_files_in_folder(project_id, folder_id)
+                else:
+                    pages = (future.result(),)
+                for page in pages:
+                    files.extend(page)
+
+                    def ui_page(page=page):
+                        if load_id != self._files_load_id:
+                            return
+                        for item in page:
+                            self._file_items.Add(item)
+                    self._window.Dispatcher.BeginInvoke(DispatcherPriority.Background, Action(ui_page))
+            except Exception as ex:
+                error = ex
+            if owner:
+                if error is None:
+                    self._tree_cache[key] = (time.monotonic() + TREE_CACHE_TTL_SECONDS, files)
+                self._finish_fetch(key, future, files, error)
+
+            if error is None:
+                def ui_done():
+                    if load_id == self._files_load_id:
+                        self._show_files_status(files)
+                        self._set_files_loading(False)
+                self._window.Dispatcher.BeginInvoke(DispatcherPriority.Background, Action(ui_done))
             else:
-                self.status_text.Text = "No files in this folder. Select a subfolder."
-        except Exception as ex:
-            self.log("Failed to load files: {0}".format(ex))
-            self.status_text.Text = "File load failed"
+                def ui_fail():
+                    self.log("Failed to load files: {0}".format(error))
+                    if load_id == self._files_load_id:
+                        self.status_text.Text = "File load failed"
+                        self._set_files_loading(False)
+                self._window.Dispatcher.BeginInvoke(DispatcherPriority.Background, Action(ui_fail))
+
+        t = Thread(ThreadStart(worker))
+        t.IsBackground = True
+        t.Start()
 
     def on_load_folder_url(self, sender, args):
         if not self._data_client:
             MessageBox.Show("Sign in first.", TITLE, MessageBoxButton.OK, MessageBoxImage.Warning)
             return
         url = (self.folder_url_box.Text or "").strip() if self.folder_url_box else ""
-        project_id, folder_id = self._parse_folder_url(url)
+        project_id, folder_id = _parse_folder_url(url)
         if not folder_id:
             MessageBox.Show("Invalid folder URL. Paste a Project Files folder URL from ACC.", TITLE, MessageBoxButton.OK, MessageBoxImage.Warning)
             return
 
         candidates = []
         if project_id:
-            candidates.extend(self._normalize_project_id(project_id))
+            candidates.extend(_normalize_project_id(project_id))
 
         project = self.project_combo.SelectedItem
         if project and project.Id not in candidates:
@@ -1539,6 +2072,8 @@ class AccDocsWindow(object):
             return
 
         self._active_folder_id = folder_id
+        self._files_load_id += 1
+        load_id = self._files_load_id
 
         try:
             self._config.last_folder_url = url
@@ -1549,22 +2084,23 @@ class AccDocsWindow(object):
         if self.load_folder_button:
             self.load_folder_button.IsEnabled = False
         self.status_text.Text = "Loading files from URL..."
+        self._set_files_loading(True)
 
         def worker():
             last_error = None
             for pid in candidates:
                 try:
-                    files = self._data_client.get_files_in_folder(pid, folder_id)
+                    files = self._cached_fetch("files", pid, folder_id, self._data_client.get_files_in_folder)
                     def ui_ok():
-                        self._file_items.Clear()
-                        for item in files:
-                            self._file_items.Add(item)
+                        _bulk_replace(self._file_items, files)
                         if files:
                             self.status_text.Text = "Files loaded from URL"
                         else:
                             self.status_text.Text = "No files in this folder."
                         if self.load_folder_button:
                             self.load_folder_button.IsEnabled = True
+                        if load_id == self._files_load_id:
+                            self._set_files_loading(False)
                     self._window.Dispatcher.Invoke(Action(ui_ok))
                     return
                 except Exception as ex:
@@ -1578,6 +2114,8 @@ class AccDocsWindow(object):
                 self.log("Failed to load folder URL: {0}".format(last_error))
                 if self.load_folder_button:
                     self.load_folder_button.IsEnabled = True
+                if load_id == self._files_load_id:
+                    self._set_files_loading(False)
             self._window.Dispatcher.Invoke(Action(ui_fail))
 
         t = Thread(ThreadStart(worker))
@@ -1585,6 +2123,12 @@ class AccDocsWindow(object):
         t.Start()
 
     def on_browse_excel(self, sender, args):
+        if self._excel_loading or self._applying:
+            self.log("Wait for the current Excel load or update to finish.")
+            return
+
+        from Microsoft.Win32 import OpenFileDialog
+
         dialog = OpenFileDialog()
         dialog.Filter = "Excel Files (*.xlsx)|*.xlsx|Excel Files (*.xls)|*.xls"
         dialog.Multiselect = False
@@ -1592,27 +2136,15 @@ class AccDocsWindow(object):
             return
 
         self.excel_path_box.Text = dialog.FileName
-        try:
-            self._excel_rows = ExcelReader.read_excel(dialog.FileName)
-            unique_rows = set()
-            try:
-                unique_rows = set([x.FileName for x in self._excel_rows.values() if x])
-            except Exception:
-                unique_rows = set()
-            self.excel_status_text.Text = "Loaded {0} rows from Excel (case-insensitive; extension optional).".format(len(unique_rows))
-            self.log("Excel loaded: {0}".format(dialog.FileName))
-            self._log_excel_diagnostics()
-            try:
-                self._config.last_excel_path = dialog.FileName
-                pyrevit_script.save_config()
-            except Exception:
-                pass
-        except Exception as ex:
-            self._excel_rows = None
-            self.excel_status_text.Text = "Excel load failed."
-            self.log("Excel load failed: {0}".format(ex))
+        self._load_excel_async(dialog.FileName, remember_path=True)
 
     def on_apply_descriptions(self, sender, args):
+        if self._excel_loading or self._applying:
+            self.log("Wait for the current Excel load or update to finish.")
+            return
+        if self._files_loading:
+            self.log("Wait for the folder's files to finish loading.")
+            return
         if not self._excel_rows:
             MessageBox.Show("Load an Excel file first.", TITLE, MessageBoxButton.OK, MessageBoxImage.Warning)
             return
@@ -1621,8 +2153,6 @@ class AccDocsWindow(object):
         if project is None:
             return
 
-        updated = 0
-        skipped = 0
         try:
             keys_sample = []
             for key in self._excel_rows.keys():
@@ -1634,66 +2164,125 @@ class AccDocsWindow(object):
         except Exception:
             pass
 
-        for file_item in list(self._file_items):
-            item_label = "{0} [{1}]".format(file_item.DisplayName, file_item.ExtensionType)
-            if not file_item.Id:
-                skipped += 1
-                self.log("Skipped (missing item id): {0}".format(item_label))
-                continue
+        # snapshot UI state here; the pool threads must not touch it, and the
+        # client is held so closing the window cannot pull it from under them
+        data_client = self._data_client
+        file_items = list(self._file_items)
+        folder_id = self._get_active_folder_id()
+        rows = self._excel_rows
+        # every row shares the sheet's header keys; normalize each one once
+        header_keys = {}
+        total = len(file_items)
+
+        self._applying = True
+        self._apply_cancelled = False
+        self._update_action_buttons()
+        self.status_text.Text = "Updating 0/{0}...".format(total)
 
-            row_key = ExcelReader._normalize_name(file_item.DisplayName)
-            row = self._excel_rows.get(row_key)
-            if not row:
-                row_key_base = ExcelReader._normalize_base(file_item.DisplayName)
-                row = self._excel_rows.get(row_key_base)
-            if not row:
-                skipped += 1
-                self.log("Skipped (no Excel row): {0} | key='{1}' base='{2}'".format(item_label, row_key, row_key_base))
-                continue
+        def worker():
+            updated = 0
+            skipped = 0
+            done = 0
+            try:
+                with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as pool:
+                    futures = {
+                        pool.submit(self._apply_file_updates, data_client, project, folder_id, file_item, rows, header_keys): index
+                        for index, file_item in enumerate(file_items)
+                    }
+                    for future in as_completed(futures):
+                        applied, skip = future.result()
+                        updated += applied
+                        skipped += skip
+                        done += 1
+                        progress = "Updating {0}/{1}...".format(done, total)
+                        changed = futures[future] if applied else None
+
+                        def ui_progress(text=progress, index=changed):
+                            self.status_text.Text = text
+                            if index is not None:
+                                self._refresh_file_row(index, file_items[index])
+                        self._window.Dispatcher.BeginInvoke(DispatcherPriority.Background, Action(ui_progress))
+            except Exception as ex:
+                self.log("Update failed: {0}".format(ex))
 
-            row_attrs = row.Attributes or {}
-            if (not row_attrs) and row.Description:
-                row_attrs = {"description": row.Description}
+            def ui_done():
+                self._applying = False
+                self._update_action_buttons()
+                self.status_text.Text = "Update complete"
+                self.log("Update finished. Updated: {0}, Skipped: {1}".format(updated, skipped))
+            # same priority as the progress posts, so it runs after all of them
+            self._window.Dispatcher.BeginInvoke(DispatcherPriority.Background, Action(ui_done))
 
-            normalized_attrs = {}
-            custom_attr_values = {}
-            for key, value in row_attrs.items():
-                norm_key = ExcelReader._normalize_name(key)
-                text_val = "" if value is None else str(value).strip()
-                if not text_val:
-                    continue
-                alias = EXCEL_ATTRIBUTE_ALIASES.get(norm_key)
-                if alias:
-                    if alias not in normalized_attrs:
-                        normalized_attrs[alias] = text_val
-                else:
-                    if norm_key and norm_key not in custom_attr_values:
-                        custom_attr_values[norm_key] = text_val
+        t = Thread(ThreadStart(worker))
+        t.IsBackground = True
+        t.Start()
 
-            if not normalized_attrs and not custom_attr_values:
-                skipped += 1
-                self.log("Skipped (no supported attributes): {0} | excel='{1}'".format(item_label, row.FileName))
+    def _refresh_file_row(self, index, file_item):
+        # FileItem is a plain Python object and raises no PropertyChanged;
+        # re-setting the same instance can leave the realized row's bindings
+        # stale, so remove and re-insert it to get a fresh container
+        try:
+            if index < self._file_items.Count and self._file_items[index] is file_item:
+                self._file_items.RemoveAt(index)
+                self._file_items.Insert(index, file_item)
+        except Exception:
+            pass
+
+    def _apply_file_updates(self, data_client, project, folder_id, file_item, rows, header_keys):
+        # runs on a pool thread; returns (attributes applied, files skipped)
+        if self._apply_cancelled:
+            return 0, 0
+        item_label = "{0} [{1}]".format(file_item.DisplayName, file_item.ExtensionType)
+        if not file_item.Id:
+            self.log("Skipped (missing item id): {0}".format(item_label))
+            return 0, 1
+
+        row_key = ExcelReader._normalize_name(file_item.DisplayName)
+        row = rows.get(row_key)
+        if not row:
+            # rows are also keyed by the name without its extension
+            row_key_base = row_key.rpartition(".")[0] or row_key
+            row = rows.get(row_key_base)
+        if not row:
+            self.log("Skipped (no Excel row): {0} | key='{1}' base='{2}'".format(item_label, row_key, row_key_base))
+            return 0, 1
+
+        row_attrs = row.Attributes or {}
+        if (not row_attrs) and row.Description:
+            row_attrs = {"description": row.Description}
+
+        normalized_attrs = {}
+        custom_attr_values = {}
+        for key, value in row_attrs.items():
+            norm_key = header_keys.get(key)
+            if norm_key is None:
+                norm_key = header_keys[key] = ExcelReader._normalize_name(key)
+            text_val = "" if value is None else str(value).strip()
+            if not text_val:
                 continue
+            alias = EXCEL_ATTRIBUTE_ALIASES.get(norm_key)
+            if alias:
+                if alias not in normalized_attrs:
+                    normalized_attrs[alias] = text_val
+            else:
+                if norm_key and norm_key not in custom_attr_values:
+                    custom_attr_values[norm_key] = text_val
 
-            try:
+        if not normalized_attrs and not custom_attr_values:
+            self.log("Skipped (no supported attributes): {0} | excel='{1}'".format(item_label, row.FileName))
+            return 0, 1
+
+        try:
+            if self._verbose:
                 try:
                     preview_bits = []
                     if "description" in normalized_attrs:
-                        desc_preview = normalized_attrs["description"]
-                        if len(desc_preview) > 80:
-                            desc_preview = desc_preview[:77] + "..."
-                        preview_bits.append("desc='{0}'".format(desc_preview))
+                        preview_bits.append("desc='{0}'".format(_truncate(normalized_attrs["description"], 80)))
                     if "display_name" in normalized_attrs:
-                        name_preview = normalized_attrs["display_name"]
-                        if len(name_preview) > 80:
-                            name_preview = name_preview[:77] + "..."
-                        preview_bits.append("display='{0}'".format(name_preview))
+                        preview_bits.append("display='{0}'".format(_truncate(normalized_attrs["display_name"], 80)))
                     if "item_description" in normalized_attrs:
-                        item_desc_preview = normalized_attrs["item_description"]
-                        if len(item_desc_preview) > 80:
-                            item_desc_preview = item_desc_preview[:77] + "..."
-                        preview_bits.append("item_desc='{0}'".format(item_desc_preview))
-                    self.log("Updating: {0} | type={1} | item_id={2} | {3}".format(
+                        preview_bits.append("item_desc='{0}'".format(_truncate(normalized_attrs["item_description"], 80)))
+                    self.log(_FMT_UPDATING.format(
                         file_item.DisplayName,
                         file_item.ExtensionType,
                         file_item.Id,
@@ -1702,190 +2291,144 @@ class AccDocsWindow(object):
                 except Exception:
                     pass
 
-                tip = None
-                need_item_detail = ("description" in normalized_attrs) or bool(custom_attr_values)
-                if need_item_detail:
-                    try:
-                        item_json = self._data_client.get_item_detail(project.Id, file_item.Id)
-                        item_root = json.loads(item_json) if item_json else {}
-                        item_data = item_root.get("data", {}) if isinstance(item_root, dict) else {}
-                        item_attrs = item_data.get("attributes", {}) if isinstance(item_data, dict) else {}
-                        ext = item_attrs.get("extension", {}) if isinstance(item_attrs, dict) else {}
-                        ext_type = ext.get("type", "")
-                        ext_data = ext.get("data", {}) if isinstance(ext, dict) else {}
-                        current_desc = ext_data.get("description", "")
-                        try:
-                            rel = item_data.get("relationships", {}) if isinstance(item_data, dict) else {}
-                            tip_rel = rel.get("tip", {}) if isinstance(rel, dict) else {}
-                            tip_data = tip_rel.get("data", {}) if isinstance(tip_rel, dict) else {}
-                            tip = tip_data.get("id", None)
-                        except Exception:
-                            tip = None
-                        self.log("Pre-update item: ext_type='{0}' desc='{1}' tip='{2}'".format(ext_type, current_desc, tip or ""))
-                    except Exception as ex:
-                        self.log("Pre-update fetch failed: {0}".format(ex))
-                        tip = None
-
-                if "description" in normalized_attrs:
-                    if file_item.ExtensionType == "items:autodesk.bim360:C4RModel":
-                        self.log("Skipped description (C4RModel not supported): {0}".format(item_label))
-                        normalized_attrs.pop("description", None)
-                    elif not tip:
-                        self.log("Skipped description (missing tip version id): {0}".format(item_label))
-                        normalized_attrs.pop("description", None)
-                    elif file_item.ExtensionType and file_item.ExtensionType.startswith("items:autodesk.bim360"):
-                        # BIM360 PATCH /versions does not support description; use PATCH /items instead
-                        if "item_description" not in normalized_attrs:
-                            normalized_attrs["item_description"] = normalized_attrs.pop("description")
-                        else:
-                            normalized_attrs.pop("description", None)
-
-                applied = 0
-                if "description" in normalized_attrs and tip:
-                    self._data_client.update_version_description(project.Id, tip, normalized_attrs["description"])
-                    file_item.Description = normalized_attrs["description"]
-                    applied += 1
-
-                if "item_description" in normalized_attrs:
-                    self._data_client.update_file_description(project.Id, file_item.Id, normalized_attrs["item_description"])
-                    file_item.Description = normalized_attrs["item_description"]
-                    applied += 1
-
-                if "display_name" in normalized_attrs:
-                    self._data_client.update_item_display_name(project.Id, file_item.Id, normalized_attrs["display_name"])
-                    file_item.DisplayName = normalized_attrs["display_name"]
-                    applied += 1
-
-                if custom_attr_values:
+            # only items listed without a tip need the per-item detail GET;
+            # the extension type always comes from the listing
+            tip = file_item.TipId
+            is_c4r = file_item.ExtensionType == "items:autodesk.bim360:C4RModel"
+            need_item_detail = not tip and (("description" in normalized_attrs and not is_c4r) or bool(custom_attr_values))
+            detail_key = (project.Id, file_item.Id)
+            if need_item_detail:
+                try:
+                    tip = self._item_detail_cache.get(detail_key)
                     if not tip:
-                        self.log("Skipped custom attributes (missing tip version id): {0}".format(item_label))
+                        item_json = data_client.get_item_detail(project.Id, file_item.Id)
+                        tip = extract_item_tip(item_json)
+                        # a missing tip is not cached so the next apply asks again
+                        if tip:
+                            self._item_detail_cache[detail_key] = tip
+                    if self._verbose:
+                        self.log("Pre-update item: tip='{0}'".format(tip or ""))
+                except Exception as ex:
+                    self.log("Pre-update fetch failed: {0}".format(ex))
+                    tip = None
+
+            if "description" in normalized_attrs:
+                if is_c4r:
+                    self.log("Skipped description (C4RModel not supported): {0}".format(item_label))
+                    normalized_attrs.pop("description", None)
+                elif not tip:
+                    self.log("Skipped description (missing tip version id): {0}".format(item_label))
+                    normalized_attrs.pop("description", None)
+                elif file_item.ExtensionType and file_item.ExtensionType.startswith("items:autodesk.bim360"):
+                    # BIM360 PATCH /versions does not support description; use PATCH /items instead
+                    if "item_description" not in normalized_attrs:
+                        normalized_attrs["item_description"] = normalized_attrs.pop("description")
                     else:
-                        folder_id = self._get_active_folder_id()
-                        defs_map = self._get_custom_attribute_definitions(project.Id, folder_id)
-                        attrs_payload = []
-                        missing_defs = []
-                        for key, value in custom_attr_values.items():
-                            definition = defs_map.get(key)
-                            if not definition or not definition.get("id"):
-                                missing_defs.append(key)
-                                continue
-                            attrs_payload.append({
-                                "id": definition.get("id"),
-                                "value": value,
-                            })
-                        if missing_defs:
-                            self.log("Custom attributes not found in folder definitions: {0}".format(", ".join(missing_defs)))
-                        if attrs_payload:
-                            self._data_client.update_version_custom_attributes(project.Id, tip, attrs_payload)
-                            applied += len(attrs_payload)
-
-                if applied:
-                    updated += applied
-                    self.log("Updated: {0} ({1} attribute{2})".format(
-                        item_label,
-                        applied,
-                        "" if applied == 1 else "s",
-                    ))
-                else:
-                    skipped += 1
-                    self.log("Skipped (no applicable updates): {0}".format(item_label))
-            except Exception as ex:
-                self.log("Failed to update {0}: {1}".format(item_label, ex))
-
-        try:
-            self.file_list.Items.Refresh()
-        except Exception:
-            pass
-
-        self.status_text.Text = "Update complete"
-        self.log("Update finished. Updated: {0}, Skipped: {1}".format(updated, skipped))
-
-    def _parse_folder_url(self, url):
-        if not url:
-            return None, None
-        project_id = None
-        folder_id = None
-
-        try:
-            uri = Uri(url)
-            if uri and uri.Query:
-                query = uri.Query.lstrip("?")
-                parts = query.split("&")
-                for part in parts:
-                    if part.startswith("folderUrn="):
-                        folder_id = Uri.UnescapeDataString(part.split("=", 1)[1])
-                    if part.startswith("projectId="):
-                        project_id = Uri.UnescapeDataString(part.split("=", 1)[1])
-        except Exception:
-            pass
-
-        m = re.search(r"/projects/([a-zA-Z0-9\-\.]+)", url)
-        if m:
-            project_id = m.group(1)
-
-        if not folder_id:
-            m = re.search(r"/folders/([^/?#]+)", url)
-            if m:
-                folder_id = Uri.UnescapeDataString(m.group(1))
+                        normalized_attrs.pop("description", None)
 
-        if folder_id and folder_id.startswith("urn%3A"):
-            try:
-                folder_id = Uri.UnescapeDataString(folder_id)
-            except Exception:
-                pass
+            applied = 0
+            if "description" in normalized_attrs and tip:
+                data_client.update_version_description(project.Id, tip, normalized_attrs["description"])
+                file_item.Description = normalized_attrs["description"]
+                self._item_detail_cache.pop(detail_key, None)
+                applied += 1
+
+            if "item_description" in normalized_attrs:
+                data_client.update_file_description(project.Id, file_item.Id, normalized_attrs["item_description"])
+                file_item.Description = normalized_attrs["item_description"]
+                self._item_detail_cache.pop(detail_key, None)
+                applied += 1
+
+            if "display_name" in normalized_attrs:
+                data_client.update_item_display_name(project.Id, file_item.Id, normalized_attrs["display_name"])
+                file_item.DisplayName = normalized_attrs["display_name"]
+                applied += 1
+
+            if custom_attr_values:
+                if not tip:
+                    self.log("Skipped custom attributes (missing tip version id): {0}".format(item_label))
+                else:
+                    with self._custom_attr_defs_lock:
+                        defs_map = self._get_custom_attribute_definitions(data_client, project.Id, folder_id)
+                    attrs_payload = []
+                    missing_defs = []
+                    for key, value in custom_attr_values.items():
+                        definition = defs_map.get(key)
+                        if not definition or not definition.get("id"):
+                            missing_defs.append(key)
+                            continue
+                        attrs_payload.append({
+                            "id": definition.get("id"),
+                            "value": value,
+                        })
+                    if missing_defs:
+                        self.log("Custom attributes not found in folder definitions: {0}".format(", ".join(missing_defs)))
+                    if attrs_payload:
+                        data_client.update_version_custom_attributes(project.Id, tip, attrs_payload)
+                        applied += len(attrs_payload)
+
+            if applied:
+                self.log("Updated: {0} ({1} attribute{2})".format(
+                    item_label,
+                    applied,
+                    "" if applied == 1 else "s",
+                ))
+                return applied, 0
+            self.log("Skipped (no applicable updates): {0}".format(item_label))
+            return 0, 1
+        except Exception as ex:
+            self.log("Failed to update {0}: {1}".format(item_label, ex))
+            return 0, 0
 
-        return project_id, folder_id
+    def log(self, message):
+        self._log_lines([message])
 
-    def _normalize_project_id(self, project_id):
-        ids = []
-        if not project_id:
-            return ids
-        pid = project_id.strip()
-        if pid.startswith("urn:"):
-            try:
-                tail = pid.split(":")[-1]
-            except Exception:
-                tail = pid
-            pid = tail or pid
-        ids.append(pid)
-        if not (pid.startswith("b.") or pid.startswith("a.")):
-            ids.append("b." + pid)
-            ids.append("a." + pid)
-        # de-dupe
-        result = []
-        for x in ids:
-            if x and x not in result:
-                result.append(x)
-        return result
+    def _log_lines(self, messages):
+        # safe from any thread: deque.append is atomic
+        if self.log_box is None or not messages:
+            return
+        stamp = DateTime.Now.ToString("HH:mm:ss")
+        self._log_queue.append("".join("{0}  {1}\n".format(stamp, m) for m in messages))
 
-    def log(self, message):
-        if self.log_box is None:
+    def _flush_log(self, sender=None, args=None):
+        queue = self._log_queue
+        if not queue:
             return
+        chunks = []
         try:
-            if self._window is not None and not self._window.Dispatcher.CheckAccess():
-                def _ui_log():
-                    self.log(message)
-                self._window.Dispatcher.Invoke(Action(_ui_log))
-                return
-        except Exception:
+            while True:
+                chunks.append(queue.popleft())
+        except IndexError:
             pass
-        stamp = DateTime.Now.ToString("HH:mm:ss")
-        self.log_box.AppendText("{0}  {1}\n".format(stamp, message))
+        self.log_box.AppendText("".join(chunks))
         self.log_box.ScrollToEnd()
 
 
 def build_form_body(form):
-    parts = []
-    for key, value in form.items():
-        parts.append(Uri.EscapeDataString(key) + "=" + Uri.EscapeDataString(value or ""))
-    return "&".join(parts)
+    # quote with RFC 3986 unreserved chars matches Uri.EscapeDataString
+    # without a .NET call per key and value
+    return "&".join(
+        _url_quote(key, safe="-_.~") + "=" + _url_quote(value or "", safe="-_.~")
+        for key, value in form.items()
+    )
 
 
-def http_send(method, url, body, content_type, headers):
+def http_send(method, url, body, content_type, headers, response_info=None):
     request = WebRequest.Create(url)
     request.Method = method
     request.Accept = "application/json, application/vnd.api+json"
     request.UserAgent = "WWP BIM Tools"
+    request.KeepAlive = True
+    request.AutomaticDecompression = DecompressionMethods.GZip | DecompressionMethods.Deflate
+    # only on this host's ServicePoint, not the ServicePointManager defaults
+    # that Revit and other add-ins share: skip the "100 Continue" round trip
+    # on POST/PATCH and Nagle's delay on small request bodies, and lift the
+    # default of 2 keep-alive connections so the Apply pool and the client
+    # pool (MAX_PARALLEL_REQUESTS each) are not serialized
+    service_point = request.ServicePoint
+    service_point.ConnectionLimit = MAX_PARALLEL_REQUESTS * 2
+    service_point.Expect100Continue = False
+    service_point.UseNagleAlgorithm = False
 
     if content_type:
         request.ContentType = content_type
@@ -1905,20 +2448,201 @@ def http_send(method, url, body, content_type, headers):
 
     try:
         response = request.GetResponse()
-        reader = StreamReader(response.GetResponseStream())
-        text = reader.ReadToEnd()
-        reader.Close()
-        response.Close()
-        return text
+        if response_info is not None:
+            response_info["status"] = int(response.StatusCode)
+            response_info["etag"] = response.Headers["ETag"]
+        return _read_response_text(response)
     except WebException as ex:
         if ex.Response:
-            reader = StreamReader(ex.Response.GetResponseStream())
-            error_text = reader.ReadToEnd()
-            reader.Close()
-            raise Exception(error_text)
+            # HttpWebRequest surfaces 304 Not Modified as an error
+            if response_info is not None and int(ex.Response.StatusCode) == 304:
+                response_info["status"] = 304
+                ex.Response.Close()
+                return None
+            raise Exception(_read_response_text(ex.Response))
         raise
 
 
+def _read_response_text(response):
+    # one large buffer instead of the default 1 KB keeps ReadToEnd from
+    # issuing hundreds of small socket reads on big folder listings
+    reader = StreamReader(response.GetResponseStream(), Encoding.UTF8, True, RESPONSE_BUFFER_SIZE)
+    try:
+        return reader.ReadToEnd()
+    finally:
+        reader.Close()
+        response.Close()
+
+
+def _etag_cache_path():
+    base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    return os.path.join(base, "WWP", "acc_etag.json")
+
+
+def _load_etag_cache():
+    path = _etag_cache_path()
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as fh:
+            data = json.load(fh)
+        return dict((url, (entry[0], entry[1])) for url, entry in data.items())
+    except Exception:
+        return {}
+
+
+def _save_etag_cache(entries):
+    # entries is a (url, (etag, body)) list already trimmed to ETAG_CACHE_MAX_CHARS
+    path = _etag_cache_path()
+    tmp_path = path + ".tmp"
+    try:
+        folder = os.path.dirname(path)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        with open(tmp_path, "w") as fh:
+            json.dump(dict((url, list(entry)) for url, entry in entries), fh)
+        os.replace(tmp_path, path)
+    except Exception:
+        pass
+
+
+def _excel_cache_path(path):
+    base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    digest = hashlib.sha1(os.path.abspath(path).lower().encode("utf-8")).hexdigest()
+    return os.path.join(base, "WWP", "excel_cache", digest + ".json")
+
+
+def _load_excel_cached(path):
+    # reuse the parsed mapping while the workbook's mtime and size match
+    try:
+        stat = os.stat(path)
+        meta = [EXCEL_CACHE_VERSION, stat.st_mtime, stat.st_size]
+    except Exception:
+        return ExcelReader.read_excel(path)
+
+    cache_path = _excel_cache_path(path)
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r") as fh:
+                data = json.load(fh)
+            if data.get("meta") == meta:
+                row_objs = [ExcelRow(r[0], r[1], r[2]) for r in data["rows"]]
+                ExcelReader.LastDiagnostics = data.get("diagnostics")
+                return dict((key, row_objs[i]) for key, i in data["keys"].items())
+        except Exception:
+            pass
+
+    rows = ExcelReader.read_excel(path)
+    try:
+        # full and base names share one ExcelRow; store each row once
+        indexes = {}
+        row_list = []
+        keys = {}
+        for key, row in rows.items():
+            i = indexes.get(id(row))
+            if i is None:
+                i = indexes[id(row)] = len(row_list)
+                row_list.append([row.FileName, row.Description, row.Attributes])
+            keys[key] = i
+        folder = os.path.dirname(cache_path)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        # diagnostic samples hold raw cell values (datetime for date cells);
+        # write to a temp file so a failed dump never leaves a truncated cache
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w") as fh:
+            json.dump({
+                "meta": meta,
+                "rows": row_list,
+                "keys": keys,
+                "diagnostics": ExcelReader.LastDiagnostics,
+            }, fh, default=str)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        pass
+    return rows
+
+
+def _query_param(query, name):
+    key = name + "="
+    start = 0
+    while True:
+        i = query.find(key, start)
+        if i < 0:
+            return None
+        # only a whole parameter name counts, not a suffix of another one
+        if i == 0 or query[i - 1] == "&":
+            i += len(key)
+            end = query.find("&", i)
+            return query[i:end] if end >= 0 else query[i:]
+        start = i + 1
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_folder_url(url):
+    if not url:
+        return None, None
+    project_id = None
+    folder_id = None
+    # without a "%" every unescape below is a no-op
+    needs_unescape = "%" in url
+
+    q = url.find("?")
+    if q >= 0:
+        end = url.find("#", q)
+        query = url[q + 1:end] if end >= 0 else url[q + 1:]
+        folder_id = _query_param(query, "folderUrn")
+        project_id = _query_param(query, "projectId")
+        try:
+            if folder_id and "%" in folder_id:
+                folder_id = Uri.UnescapeDataString(folder_id)
+            if project_id and "%" in project_id:
+                project_id = Uri.UnescapeDataString(project_id)
+        except Exception:
+            pass
+
+    m = _PROJECT_URL_RE.search(url)
+    if m:
+        project_id = m.group(1)
+
+    if not folder_id:
+        m = _FOLDER_URL_RE.search(url)
+        if m:
+            folder_id = m.group(1)
+            if needs_unescape:
+                folder_id = Uri.UnescapeDataString(folder_id)
+
+    if needs_unescape and folder_id and folder_id.startswith("urn%3A"):
+        try:
+            folder_id = Uri.UnescapeDataString(folder_id)
+        except Exception:
+            pass
+
+    return project_id, folder_id
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_project_id(project_id):
+    if not project_id:
+        return ()
+    pid = project_id.strip()
+    if pid.startswith("urn:"):
+        pid = pid.split(":")[-1] or pid
+    if not pid:
+        return ()
+    if pid.startswith("b.") or pid.startswith("a."):
+        return (pid,)
+    return (pid, "b." + pid, "a." + pid)
+
+
+def extract_item_tip(json_text):
+    """Return the tip version id from an item response, or None."""
+    try:
+        return _fast_loads(json_text)["data"]["relationships"]["tip"]["data"].get("id")
+    except (KeyError, TypeError, AttributeError, ValueError):
+        return None
+
+
 def get_next_link(root):
     links = root.get("links", {}) if isinstance(root, dict) else {}
     next_link = links.get("next") if isinstance(links, dict) else None